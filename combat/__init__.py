@@ -1,3 +1,3 @@
 """Combat system package."""
 from combat.chips import Chip, ChipFolder, CHIP_DATABASE, roll_chip_drop
-from combat.equipment import Equipment, EQUIPMENT_DB, roll_equipment_drop
+from combat.equipment import Equipment, EquipmentDef, EQUIPMENT_DB, roll_equipment_drop
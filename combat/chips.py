@@ -2,12 +2,21 @@
 Chips - Battle chip definitions and folder management.
 """
 
+import copy
 import random
-from dataclasses import dataclass, field
-from typing import List
+from collections import deque
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import List, Tuple
 
 
-@dataclass
+# Melee range patterns (shared by reference - never mutated)
+_SWORD_RANGE = ((1, 0),)  # 1 tile in front
+_WIDE_RANGE = ((1, -1), (1, 0), (1, 1))  # 3 tiles (column in front)
+_LONG_RANGE = ((1, 0), (2, 0))  # 2 tiles forward
+
+
+@dataclass(slots=True, frozen=True)
 class Chip:
     """A battle chip."""
     name: str
@@ -15,20 +24,22 @@ class Chip:
     power: int
     code: str
     element: str = "null"
-    range_pattern: List[tuple] = field(default_factory=list)  # For melee attacks
+    range_pattern: Tuple[Tuple[int, int], ...] = ()  # For melee attacks
     
     def __post_init__(self):
-        # Set range patterns for sword types
+        if self.range_pattern:
+            return
+        # Set range patterns for sword types (frozen, so bypass __setattr__)
         if self.chip_type == "sword":
-            self.range_pattern = [(1, 0)]  # 1 tile in front
+            object.__setattr__(self, "range_pattern", _SWORD_RANGE)
         elif self.chip_type == "widesword":
-            self.range_pattern = [(1, -1), (1, 0), (1, 1)]  # 3 tiles (column in front)
+            object.__setattr__(self, "range_pattern", _WIDE_RANGE)
         elif self.chip_type == "longsword":
-            self.range_pattern = [(1, 0), (2, 0)]  # 2 tiles forward
+            object.__setattr__(self, "range_pattern", _LONG_RANGE)
 
 
 # Chip database - all possible chips
-CHIP_DATABASE = {
+CHIP_DATABASE = MappingProxyType({
     # Buster-type (projectile)
     "Cannon": Chip("Cannon", "attack", 40, "A"),
     "HiCannon": Chip("HiCannon", "attack", 60, "H"),
@@ -52,7 +63,7 @@ CHIP_DATABASE = {
     # Defense
     "Barrier": Chip("Barrier", "defense", 10, "B"),
     "Invis": Chip("Invis", "defense", 0, "I"),
-}
+})
 
 # Chips that can drop from viruses (with rarity weights)
 DROPPABLE_CHIPS = {
@@ -74,6 +85,46 @@ DROPPABLE_CHIPS = {
 }
 
 
+def _build_alias_table(weights: List[int]) -> Tuple[List[float], List[int]]:
+    """Build a Vose alias table (probability + alias arrays) for weighted draws."""
+    n = len(weights)
+    total = sum(weights)
+    scaled = [w * n / total for w in weights]
+    prob = [0.0] * n
+    alias = [0] * n
+    
+    small = deque(i for i, p in enumerate(scaled) if p < 1.0)
+    large = deque(i for i, p in enumerate(scaled) if p >= 1.0)
+    
+    while small and large:
+        lo = small.popleft()
+        hi = large.popleft()
+        prob[lo] = scaled[lo]
+        alias[lo] = hi
+        scaled[hi] = (scaled[hi] + scaled[lo]) - 1.0
+        if scaled[hi] < 1.0:
+            small.append(hi)
+        else:
+            large.append(hi)
+    
+    # Leftovers are 1.0 up to float rounding
+    for i in large:
+        prob[i] = 1.0
+    for i in small:
+        prob[i] = 1.0
+    
+    return prob, alias
+
+
+# 4% drop rate as a 16-bit integer threshold (cheap early reject)
+_NO_DROP_THRESHOLD = int(0.96 * 65536)
+
+# Precomputed alias table for chip drops - O(1) per roll
+_CHIP_NAMES = list(DROPPABLE_CHIPS)
+_CHIP_PROB, _CHIP_ALIAS = _build_alias_table(list(DROPPABLE_CHIPS.values()))
+_CHIP_COUNT = len(_CHIP_NAMES)
+
+
 class ChipFolder:
     """Player's battle chip folder."""
     
@@ -86,10 +137,10 @@ class ChipFolder:
         if len(self.chips) >= self.max_size:
             return False
         if chip_name in CHIP_DATABASE:
-            # Create a copy of the chip
-            orig = CHIP_DATABASE[chip_name]
-            new_chip = Chip(orig.name, orig.chip_type, orig.power, orig.code, orig.element)
-            self.chips.append(new_chip)
+            # Shallow copy of the template (range_pattern is shared).
+            # FolderScene matches folder entries to owned chips by identity
+            # (equal chips compare equal), so each needs its own instance.
+            self.chips.append(copy.copy(CHIP_DATABASE[chip_name]))
             return True
         return False
     
@@ -102,11 +153,10 @@ class ChipFolder:
     
     def draw_chips(self, count: int = 5) -> List[Chip]:
         """Draw random chips from folder for custom screen."""
-        if not self.chips:
+        k = min(count, len(self.chips))
+        if k <= 0:
             return []
-        available = self.chips.copy()
-        random.shuffle(available)
-        return available[:min(count, len(available))]
+        return random.sample(self.chips, k)
     
     def get_starter_folder():
         """Create a new folder with just starter chips."""
@@ -121,17 +171,11 @@ class ChipFolder:
 def roll_chip_drop(enemy_name: str = None) -> str:
     """Roll for a chip drop. Returns chip name or None. 3-5% base drop rate."""
     # Base drop rate: 3-5%
-    if random.random() > 0.04:  # 96% chance of no drop
+    if random.getrandbits(16) < _NO_DROP_THRESHOLD:  # 96% chance of no drop
         return None
     
-    # Weighted random selection from droppable chips
-    total_weight = sum(DROPPABLE_CHIPS.values())
-    roll = random.randint(1, total_weight)
-    
-    cumulative = 0
-    for chip_name, weight in DROPPABLE_CHIPS.items():
-        cumulative += weight
-        if roll <= cumulative:
-            return chip_name
-    
-    return "Cannon"  # Fallback
+    # Weighted random selection via alias table
+    i = random.randrange(_CHIP_COUNT)
+    if random.random() < _CHIP_PROB[i]:
+        return _CHIP_NAMES[i]
+    return _CHIP_NAMES[_CHIP_ALIAS[i]]
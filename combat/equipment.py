@@ -3,105 +3,108 @@ Equipment System - Replaces NaviCust grid system.
 Simple list-based equipment with CP costs.
 """
 
+import random
+from collections import Counter
+from dataclasses import dataclass, field
+from types import MappingProxyType
+
+
+@dataclass(slots=True, frozen=True)
+class EquipmentDef:
+    """A piece of equipment."""
+    name: str
+    cost: int  # CP cost
+    stat: str  # Stat the item modifies
+    value: object  # Numeric bonus, or a special effect like "float"
+    rarity: str  # common, uncommon, rare
+    description: str
+    _numeric: bool = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        # Numeric values accumulate; anything else is a special effect
+        object.__setattr__(self, "_numeric", isinstance(self.value, (int, float)))
+
+
 # Equipment Database
-EQUIPMENT_DB = {
+EQUIPMENT_DB = MappingProxyType({
     # Common Equipment (60% drop rate)
-    "ATK+1": {
-        "name": "ATK+1",
-        "cost": 2,
-        "stat": "attack",
-        "value": 1,
-        "rarity": "common",
-        "description": "Buster Attack +1"
-    },
-    "HP+50": {
-        "name": "HP+50",
-        "cost": 3,
-        "stat": "max_hp",
-        "value": 50,
-        "rarity": "common",
-        "description": "Maximum HP +50"
-    },
-    "Speed+1": {
-        "name": "Speed+1",
-        "cost": 2,
-        "stat": "buster_speed",
-        "value": 1,
-        "rarity": "common",
-        "description": "Buster Speed +1"
-    },
+    "ATK+1": EquipmentDef(
+        "ATK+1", 2, "attack", 1,
+        "common", "Buster Attack +1"
+    ),
+    "HP+50": EquipmentDef(
+        "HP+50", 3, "max_hp", 50,
+        "common", "Maximum HP +50"
+    ),
+    "Speed+1": EquipmentDef(
+        "Speed+1", 2, "buster_speed", 1,
+        "common", "Buster Speed +1"
+    ),
     
     # Uncommon Equipment (30% drop rate)
-    "Charge+1": {
-        "name": "Charge+1",
-        "cost": 3,
-        "stat": "charge_speed",
-        "value": 1,
-        "rarity": "uncommon",
-        "description": "Charge Speed +1"
-    },
-    "Custom+1": {
-        "name": "Custom+1",
-        "cost": 3,
-        "stat": "custom_gauge",
-        "value": 1,
-        "rarity": "uncommon",
-        "description": "Custom Gauge fills faster"
-    },
-    "Shield": {
-        "name": "Shield",
-        "cost": 4,
-        "stat": "defense",
-        "value": 2,
-        "rarity": "uncommon",
-        "description": "Defense +2"
-    },
+    "Charge+1": EquipmentDef(
+        "Charge+1", 3, "charge_speed", 1,
+        "uncommon", "Charge Speed +1"
+    ),
+    "Custom+1": EquipmentDef(
+        "Custom+1", 3, "custom_gauge", 1,
+        "uncommon", "Custom Gauge fills faster"
+    ),
+    "Shield": EquipmentDef(
+        "Shield", 4, "defense", 2,
+        "uncommon", "Defense +2"
+    ),
     
     # Rare Equipment (10% drop rate)
-    "Float": {
-        "name": "Float",
-        "cost": 5,
-        "stat": "movement",
-        "value": "float",
-        "rarity": "rare",
-        "description": "Ignore panel effects"
-    },
-    "SuperArmor": {
-        "name": "SuperArmor",
-        "cost": 6,
-        "stat": "armor",
-        "value": "no_flinch",
-        "rarity": "rare",
-        "description": "No flinching from attacks"
-    },
-    "BusterPack": {
-        "name": "BusterPack",
-        "cost": 5,
-        "stat": "attack",
-        "value": 3,
-        "rarity": "rare",
-        "description": "Buster Attack +3"
-    }
-}
+    "Float": EquipmentDef(
+        "Float", 5, "movement", "float",
+        "rare", "Ignore panel effects"
+    ),
+    "SuperArmor": EquipmentDef(
+        "SuperArmor", 6, "armor", "no_flinch",
+        "rare", "No flinching from attacks"
+    ),
+    "BusterPack": EquipmentDef(
+        "BusterPack", 5, "attack", 3,
+        "rare", "Buster Attack +3"
+    ),
+})
+
+# Drop pools by rarity (EQUIPMENT_DB is static, so build once)
+_COMMON_POOL = tuple(n for n, d in EQUIPMENT_DB.items() if d.rarity == "common")
+_UNCOMMON_POOL = tuple(n for n, d in EQUIPMENT_DB.items() if d.rarity == "uncommon")
+_RARE_POOL = tuple(n for n, d in EQUIPMENT_DB.items() if d.rarity == "rare")
 
 
 class Equipment:
     """Manages equipment system - owned items, equipped items, CP limits."""
     
     def __init__(self, max_cp: int = 10):
-        self.owned = {}  # {item_name: quantity}
+        self.owned = Counter()  # {item_name: quantity}
         self.equipped = []  # [item_name, item_name, ...]
         self.max_cp = max_cp
+        
+        # Set mirror of equipped for O(1) membership; list keeps display order
+        self._equipped_set = set()
+        self._used_cp = 0
+        
+        # Stat bonuses cached until equipped items change
+        self._bonuses = {}
+        self._bonuses_dirty = True
+    
+    def _set_equipped(self, items: list):
+        """Replace the equipped list and resync derived state."""
+        self.equipped = list(items)
+        self._equipped_set = set(self.equipped)
+        self._used_cp = sum(EQUIPMENT_DB[name].cost for name in self.equipped if name in EQUIPMENT_DB)
+        self._bonuses_dirty = True
     
     def add_item(self, item_name: str):
         """Add item to owned inventory."""
         if item_name not in EQUIPMENT_DB:
             return False
         
-        if item_name in self.owned:
-            self.owned[item_name] += 1
-        else:
-            self.owned[item_name] = 1
+        self.owned[item_name] += 1
         return True
     
     def can_equip(self, item_name: str) -> bool:
@@ -109,13 +112,12 @@ class Equipment:
         if item_name not in self.owned or self.owned[item_name] <= 0:
             return False
         
-        if item_name in self.equipped:
+        if item_name in self._equipped_set:
             return False  # Already equipped
         
-        item_cost = EQUIPMENT_DB[item_name]["cost"]
-        used_cp = self.get_used_cp()
+        item_cost = EQUIPMENT_DB[item_name].cost
         
-        return (used_cp + item_cost) <= self.max_cp
+        return (self._used_cp + item_cost) <= self.max_cp
     
     def equip(self, item_name: str) -> bool:
         """Equip an item if possible."""
@@ -123,32 +125,39 @@ class Equipment:
             return False
         
         self.equipped.append(item_name)
+        self._equipped_set.add(item_name)
+        self._used_cp += EQUIPMENT_DB[item_name].cost
+        self._bonuses_dirty = True
         return True
     
     def unequip(self, item_name: str) -> bool:
         """Unequip an item."""
-        if item_name in self.equipped:
+        if item_name in self._equipped_set:
             self.equipped.remove(item_name)
+            self._equipped_set.discard(item_name)
+            if item_name in EQUIPMENT_DB:
+                self._used_cp -= EQUIPMENT_DB[item_name].cost
+            self._bonuses_dirty = True
             return True
         return False
     
     def is_equipped(self, item_name: str) -> bool:
         """Check if item is currently equipped."""
-        return item_name in self.equipped
+        return item_name in self._equipped_set
     
     def get_used_cp(self) -> int:
-        """Calculate total CP used by equipped items."""
-        total = 0
-        for item_name in self.equipped:
-            if item_name in EQUIPMENT_DB:
-                total += EQUIPMENT_DB[item_name]["cost"]
-        return total
+        """Total CP used by equipped items (maintained by equip/unequip)."""
+        return self._used_cp
     
     def get_stat_bonuses(self) -> dict:
         """
         Calculate all stat bonuses from equipped items.
         Returns dict like: {"attack": 2, "max_hp": 50, "defense": 1, ...}
+        The result is cached until equip/unequip; treat it as read-only.
         """
+        if not self._bonuses_dirty:
+            return self._bonuses
+        
         bonuses = {}
         
         for item_name in self.equipped:
@@ -156,11 +165,11 @@ class Equipment:
                 continue
             
             item = EQUIPMENT_DB[item_name]
-            stat = item["stat"]
-            value = item["value"]
+            stat = item.stat
+            value = item.value
             
             # For numeric bonuses, accumulate
-            if isinstance(value, (int, float)):
+            if item._numeric:
                 if stat in bonuses:
                     bonuses[stat] += value
                 else:
@@ -169,6 +178,8 @@ class Equipment:
                 # For special effects (like "float"), store as-is
                 bonuses[stat] = value
         
+        self._bonuses = bonuses
+        self._bonuses_dirty = False
         return bonuses
     
     def get_all_owned_items(self) -> list:
@@ -178,7 +189,7 @@ class Equipment:
     def to_dict(self) -> dict:
         """Serialize to dictionary for saving."""
         return {
-            "owned": self.owned.copy(),
+            "owned": dict(self.owned),
             "equipped": self.equipped.copy(),
             "max_cp": self.max_cp
         }
@@ -187,8 +198,8 @@ class Equipment:
     def from_dict(data: dict) -> "Equipment":
         """Deserialize from dictionary."""
         equipment = Equipment(max_cp=data.get("max_cp", 10))
-        equipment.owned = data.get("owned", {})
-        equipment.equipped = data.get("equipped", [])
+        equipment.owned = Counter(data.get("owned", {}))
+        equipment._set_equipped(data.get("equipped", []))
         return equipment
     
     @staticmethod
@@ -196,8 +207,8 @@ class Equipment:
         """Create starter equipment for new game."""
         equipment = Equipment(max_cp=10)
         # Give player 2 ATK+1 to start
-        equipment.owned = {"ATK+1": 2, "HP+50": 1}
-        equipment.equipped = ["ATK+1"]  # One equipped
+        equipment.owned = Counter({"ATK+1": 2, "HP+50": 1})
+        equipment._set_equipped(["ATK+1"])  # One equipped
         return equipment
 
 
@@ -207,8 +218,6 @@ def roll_equipment_drop() -> str | None:
     3% chance overall.
     Returns item name or None.
     """
-    import random
-    
     # 3% chance for any drop
     if random.random() >= 0.03:
         return None
@@ -217,11 +226,11 @@ def roll_equipment_drop() -> str | None:
     rarity_roll = random.random()
     
     if rarity_roll < 0.60:  # 60% common
-        pool = [name for name, data in EQUIPMENT_DB.items() if data["rarity"] == "common"]
+        pool = _COMMON_POOL
     elif rarity_roll < 0.90:  # 30% uncommon
-        pool = [name for name, data in EQUIPMENT_DB.items() if data["rarity"] == "uncommon"]
+        pool = _UNCOMMON_POOL
     else:  # 10% rare
-        pool = [name for name, data in EQUIPMENT_DB.items() if data["rarity"] == "rare"]
+        pool = _RARE_POOL
     
     if not pool:
         return None
@@ -3,33 +3,128 @@ Navi Customizer - Grid-based program system for stat boosts and abilities.
 Based on MMBN3+ NaviCust system.
 """
 
-from dataclasses import dataclass
+from collections import Counter
+from dataclasses import dataclass, field
+from functools import lru_cache
+from itertools import chain, repeat
+from types import MappingProxyType
 from typing import List, Tuple, Optional
 import json
 
 
-@dataclass
+Shape = Tuple[Tuple[int, int], ...]
+
+# Small int ids for program colors (0 = empty cell in the color grid)
+_COLOR_ID = {"pink": 1, "yellow": 2, "white": 3, "blue": 4, "red": 5, "green": 6}
+
+# How each effect combines into computed stats
+_EFFECT_ADD = 0
+_EFFECT_MUL = 1
+_EFFECT_FLAG = 2
+_EFFECT_NONE = -1
+_EFFECT_KINDS = {
+    "buster_attack": _EFFECT_ADD,
+    "buster_speed": _EFFECT_ADD,
+    "buster_charge": _EFFECT_ADD,
+    "max_hp": _EFFECT_ADD,
+    "custom_size": _EFFECT_ADD,
+    "start_barrier": _EFFECT_ADD,
+    "gauge_speed": _EFFECT_MUL,
+    "undershirt": _EFFECT_FLAG,
+    "sneak_run": _EFFECT_FLAG,
+    "collect": _EFFECT_FLAG,
+    "float_shoes": _EFFECT_FLAG,
+    "super_armor": _EFFECT_FLAG,
+}
+
+# Buster stats are capped at 5
+_CAPPED_STATS = ("buster_attack", "buster_speed", "buster_charge")
+
+
+@lru_cache(maxsize=256)
+def _rotate_shape(shape: Shape, rotation: int) -> Shape:
+    """Rotate shape 0, 90, 180, or 270 degrees."""
+    rotated = shape
+    for _ in range(rotation % 4):
+        rotated = [(-y, x) for x, y in rotated]
+        # Normalize to positive coordinates
+        min_x = min(p[0] for p in rotated)
+        min_y = min(p[1] for p in rotated)
+        rotated = [(x - min_x, y - min_y) for x, y in rotated]
+    return tuple(rotated)
+
+
+@lru_cache(maxsize=None)
+def _neighbor_table(size: int) -> Tuple[Tuple[int, ...], ...]:
+    """Orthogonal neighbor indices for each cell of a flat size x size grid."""
+    table = []
+    for idx in range(size * size):
+        x, y = idx % size, idx // size
+        neighbors = []
+        if x > 0:
+            neighbors.append(idx - 1)
+        if x < size - 1:
+            neighbors.append(idx + 1)
+        if y > 0:
+            neighbors.append(idx - size)
+        if y < size - 1:
+            neighbors.append(idx + size)
+        table.append(tuple(neighbors))
+    return tuple(table)
+
+
+@dataclass(slots=True, frozen=True)
 class NCProgram:
     """A Navi Customizer Program."""
     name: str
     color: str  # pink, yellow, white, blue, red, green
-    shape: List[Tuple[int, int]]  # List of (x, y) offsets from origin
+    shape: Shape  # (x, y) offsets from origin
     is_solid: bool  # Solid must touch command line, Plus must NOT touch
     effect: str  # Effect type
     value: int  # Effect value
     description: str
+    shape_rot: Tuple[Shape, ...] = field(init=False, repr=False, compare=False)
+    color_id: int = field(init=False, repr=False, compare=False)
+    _bounds: Tuple[int, int] = field(init=False, repr=False, compare=False)
+    _effect_kind: int = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        # Normalize shape to tuples and precompute all 4 rotations
+        shape = tuple(tuple(p) for p in self.shape)
+        object.__setattr__(self, "shape", shape)
+        object.__setattr__(self, "shape_rot", tuple(_rotate_shape(shape, r) for r in range(4)))
+        object.__setattr__(self, "color_id", _COLOR_ID[self.color])
+        if shape:
+            bounds = (max(x for x, _ in shape) + 1, max(y for _, y in shape) + 1)
+        else:
+            bounds = (1, 1)
+        object.__setattr__(self, "_bounds", bounds)
+        object.__setattr__(self, "_effect_kind", _EFFECT_KINDS.get(self.effect, _EFFECT_NONE))
     
     def get_bounds(self) -> Tuple[int, int]:
         """Get width and height of shape."""
-        if not self.shape:
-            return (1, 1)
-        max_x = max(s[0] for s in self.shape) + 1
-        max_y = max(s[1] for s in self.shape) + 1
-        return (max_x, max_y)
+        return self._bounds
+
+
+# Stats with no programs installed
+_DEFAULT_STATS = {
+    "buster_attack": 0,
+    "buster_speed": 0,
+    "buster_charge": 0,
+    "max_hp": 0,
+    "custom_size": 0,
+    "gauge_speed": 1.0,
+    "undershirt": False,
+    "sneak_run": False,
+    "collect": False,
+    "float_shoes": False,
+    "start_barrier": 0,
+    "super_armor": False,
+}
 
 
 # Program database
-NCP_DATABASE = {
+NCP_DATABASE = MappingProxyType({
     # Buster stat programs (solid - must touch command line)
     "Attack+1": NCProgram(
         "Attack+1", "pink", [(0, 0), (1, 0)], True,
@@ -91,7 +186,7 @@ NCP_DATABASE = {
         "SuperArmr", "white", [(0, 0), (1, 0), (2, 0), (1, 1)], True,
         "super_armor", 1, "No flinching from hits"
     ),
-}
+})
 
 
 class NaviCustomizer:
@@ -99,14 +194,18 @@ class NaviCustomizer:
     
     def __init__(self, grid_size: int = 4):
         self.grid_size = grid_size  # 4x4 default, can expand to 5x5
-        self.grid = [[None for _ in range(grid_size)] for _ in range(grid_size)]
+        # Flat row-major grid: cell (x, y) is grid[y * grid_size + x]
+        self.grid = [None] * (grid_size * grid_size)
+        # Parallel color-id grid so neighbor checks are a byte compare
+        self._grid_color = bytearray(grid_size * grid_size)
         self.command_line = grid_size // 2  # Middle row is command line
         
         # Installed programs with their positions
         self.installed = []  # List of (program_name, x, y, rotation)
+        self._installed_counts = Counter()  # program_name -> copies installed
         
         # Owned programs with quantities: {"Attack+1": 2, "Speed+1": 1}
-        self.owned_programs = {"Attack+1": 1, "Speed+1": 1}  # Start with 1 of each
+        self.owned_programs = Counter({"Attack+1": 1, "Speed+1": 1})  # Start with 1 of each
         
         # Computed stats from installed programs - initialize with defaults
         self.computed_stats = self._default_stats()
@@ -114,23 +213,13 @@ class NaviCustomizer:
         # Last run status
         self.last_run_ok = True
         self.last_run_bugs = []
+        
+        # Bugs found by the last _compute_stats pass
+        self._bugs = []
     
     def _default_stats(self) -> dict:
         """Return default stats dictionary."""
-        return {
-            "buster_attack": 0,
-            "buster_speed": 0,
-            "buster_charge": 0,
-            "max_hp": 0,
-            "custom_size": 0,
-            "gauge_speed": 1.0,
-            "undershirt": False,
-            "sneak_run": False,
-            "collect": False,
-            "float_shoes": False,
-            "start_barrier": 0,
-            "super_armor": False,
-        }
+        return _DEFAULT_STATS.copy()
         
     def expand_grid(self):
         """Expand grid from 4x4 to 5x5."""
@@ -138,16 +227,18 @@ class NaviCustomizer:
             return False
         
         self.grid_size = 5
-        self.grid = [[None for _ in range(5)] for _ in range(5)]
         self.command_line = 2  # Still middle row
         
         # Re-install programs
         self._rebuild_grid()
+        self._compute_stats()
         return True
     
     def _rebuild_grid(self):
         """Rebuild grid from installed programs list."""
-        self.grid = [[None for _ in range(self.grid_size)] for _ in range(self.grid_size)]
+        self.grid = [None] * (self.grid_size * self.grid_size)
+        self._grid_color = bytearray(self.grid_size * self.grid_size)
+        self._installed_counts = Counter(name for name, _, _, _ in self.installed)
         for prog_name, x, y, rotation in self.installed:
             if prog_name in NCP_DATABASE:
                 self._place_on_grid(prog_name, x, y, rotation)
@@ -158,22 +249,25 @@ class NaviCustomizer:
         if not prog:
             return False
         
-        shape = self._rotate_shape(prog.shape, rotation)
+        size = self.grid_size
+        grid = self.grid
+        grid_color = self._grid_color
+        color_id = prog.color_id
+        shape = prog.shape_rot[rotation % 4]
         for dx, dy in shape:
             gx, gy = x + dx, y + dy
-            if 0 <= gx < self.grid_size and 0 <= gy < self.grid_size:
-                self.grid[gy][gx] = prog_name
+            if 0 <= gx < size and 0 <= gy < size:
+                idx = gy * size + gx
+                grid[idx] = prog_name
+                grid_color[idx] = color_id
     
-    def _rotate_shape(self, shape: List[Tuple[int, int]], rotation: int) -> List[Tuple[int, int]]:
+    def get_cell(self, x: int, y: int) -> Optional[str]:
+        """Get the program name occupying grid cell (x, y), or None."""
+        return self.grid[y * self.grid_size + x]
+    
+    def _rotate_shape(self, shape: Shape, rotation: int) -> Shape:
         """Rotate shape 0, 90, 180, or 270 degrees."""
-        rotated = shape
-        for _ in range(rotation % 4):
-            rotated = [(-y, x) for x, y in rotated]
-            # Normalize to positive coordinates
-            min_x = min(p[0] for p in rotated)
-            min_y = min(p[1] for p in rotated)
-            rotated = [(x - min_x, y - min_y) for x, y in rotated]
-        return rotated
+        return _rotate_shape(tuple(shape), rotation)
     
     def can_install(self, prog_name: str, x: int, y: int, rotation: int = 0) -> Tuple[bool, str]:
         """Check if program can be installed at position."""
@@ -187,30 +281,33 @@ class NaviCustomizer:
             return False, "Program not owned"
         
         # Check how many are already installed
-        installed_count = sum(1 for name, _, _, _ in self.installed if name == prog_name)
+        installed_count = self._installed_counts[prog_name]
         if installed_count >= owned_count:
             return False, "All copies already installed"
         
-        shape = self._rotate_shape(prog.shape, rotation)
+        size = self.grid_size
+        grid = self.grid
+        shape = prog.shape_rot[rotation % 4]
         
         # Check bounds and overlap
+        cells = []
         for dx, dy in shape:
             gx, gy = x + dx, y + dy
-            if gx < 0 or gx >= self.grid_size or gy < 0 or gy >= self.grid_size:
+            if gx < 0 or gx >= size or gy < 0 or gy >= size:
                 return False, "Out of bounds"
-            if self.grid[gy][gx] is not None:
+            idx = gy * size + gx
+            if grid[idx] is not None:
                 return False, "Overlaps existing program"
+            cells.append(idx)
         
         # Check same-color touching (not allowed)
-        for dx, dy in shape:
-            gx, gy = x + dx, y + dy
-            for nx, ny in [(gx-1, gy), (gx+1, gy), (gx, gy-1), (gx, gy+1)]:
-                if 0 <= nx < self.grid_size and 0 <= ny < self.grid_size:
-                    neighbor = self.grid[ny][nx]
-                    if neighbor and neighbor != prog_name:
-                        neighbor_prog = NCP_DATABASE.get(neighbor)
-                        if neighbor_prog and neighbor_prog.color == prog.color:
-                            return False, "Same color programs cannot touch"
+        neighbors = _neighbor_table(size)
+        grid_color = self._grid_color
+        color_id = prog.color_id
+        for idx in cells:
+            for n in neighbors[idx]:
+                if grid_color[n] == color_id and grid[n] != prog_name:
+                    return False, "Same color programs cannot touch"
         
         return True, "OK"
     
@@ -222,6 +319,7 @@ class NaviCustomizer:
         
         self._place_on_grid(prog_name, x, y, rotation)
         self.installed.append((prog_name, x, y, rotation))
+        self._installed_counts[prog_name] += 1
         self._compute_stats()
         return True, "Installed"
     
@@ -230,100 +328,73 @@ class NaviCustomizer:
         for i, (name, x, y, rot) in enumerate(self.installed):
             if name == prog_name:
                 self.installed.pop(i)
+                self._installed_counts[prog_name] -= 1
                 self._rebuild_grid()
                 self._compute_stats()
                 return True
         return False
     
     def check_bugs(self) -> List[str]:
-        """Check for rule violations (bugs)."""
+        """Check for rule violations (bugs). Cached by _compute_stats."""
+        return self._bugs
+    
+    def _compute_stats(self):
+        """Compute stat bonuses and bugs from installed programs in one pass."""
+        stats = _DEFAULT_STATS.copy()
+        
         bugs = []
+        command_line = self.command_line
         
         for prog_name, x, y, rotation in self.installed:
             prog = NCP_DATABASE.get(prog_name)
             if not prog:
                 continue
             
-            shape = self._rotate_shape(prog.shape, rotation)
-            touches_command = any(y + dy == self.command_line for _, dy in shape)
+            shape = prog.shape_rot[rotation % 4]
+            touches_command = any(y + dy == command_line for _, dy in shape)
             
+            # Bugged programs don't provide effects
             if prog.is_solid and not touches_command:
                 bugs.append(f"{prog_name}: Solid program must touch command line")
-            elif not prog.is_solid and touches_command:
+                continue
+            if not prog.is_solid and touches_command:
                 bugs.append(f"{prog_name}: Plus program must NOT touch command line")
-        
-        return bugs
-    
-    def _compute_stats(self):
-        """Compute stat bonuses from installed programs."""
-        stats = {
-            "buster_attack": 0,
-            "buster_speed": 0,
-            "buster_charge": 0,
-            "max_hp": 0,
-            "custom_size": 0,
-            "gauge_speed": 1.0,
-            "undershirt": False,
-            "sneak_run": False,
-            "collect": False,
-            "float_shoes": False,
-            "start_barrier": 0,
-            "super_armor": False,
-        }
-        
-        bugs = self.check_bugs()
-        
-        for prog_name, x, y, rotation in self.installed:
-            prog = NCP_DATABASE.get(prog_name)
-            if not prog:
                 continue
             
-            # Check if this program is bugged
-            is_bugged = any(prog_name in bug for bug in bugs)
-            if is_bugged:
-                continue  # Bugged programs don't provide effects
-            
             # Apply effect
-            effect = prog.effect
-            if effect in ["buster_attack", "buster_speed", "buster_charge", "max_hp", "custom_size", "start_barrier"]:
-                stats[effect] += prog.value
-            elif effect == "gauge_speed":
-                stats[effect] *= prog.value
-            elif effect in ["undershirt", "sneak_run", "collect", "float_shoes", "super_armor"]:
-                stats[effect] = True
+            kind = prog._effect_kind
+            if kind == _EFFECT_ADD:
+                stats[prog.effect] += prog.value
+            elif kind == _EFFECT_MUL:
+                stats[prog.effect] *= prog.value
+            elif kind == _EFFECT_FLAG:
+                stats[prog.effect] = True
         
         # Cap buster stats at 5
-        stats["buster_attack"] = min(5, stats["buster_attack"])
-        stats["buster_speed"] = min(5, stats["buster_speed"])
-        stats["buster_charge"] = min(5, stats["buster_charge"])
+        for key in _CAPPED_STATS:
+            if stats[key] > 5:
+                stats[key] = 5
         
         self.computed_stats = stats
+        self._bugs = bugs
     
     def add_program(self, prog_name: str, count: int = 1) -> bool:
         """Add program(s) to owned inventory."""
         if prog_name in NCP_DATABASE:
-            current = self.owned_programs.get(prog_name, 0)
-            self.owned_programs[prog_name] = current + count
+            self.owned_programs[prog_name] += count
             return True
         return False
     
     def get_owned_list(self) -> list:
         """Get list of owned program names (with duplicates for quantities)."""
-        result = []
-        for name, count in self.owned_programs.items():
-            for _ in range(count):
-                result.append(name)
-        return result
+        return list(chain.from_iterable(repeat(name, count) for name, count in self.owned_programs.items()))
     
     def get_available_to_install(self) -> list:
         """Get programs that can still be installed (have remaining copies)."""
-        available = []
-        for name, count in self.owned_programs.items():
-            installed_count = sum(1 for n, _, _, _ in self.installed if n == name)
-            remaining = count - installed_count
-            if remaining > 0:
-                available.append((name, remaining))
-        return available
+        counts = self._installed_counts
+        return [(name, count - counts[name])
+                for name, count in self.owned_programs.items()
+                if count > counts[name]]
     
     def run_programs(self) -> Tuple[bool, str]:
         """
@@ -346,7 +417,7 @@ class NaviCustomizer:
         return {
             "grid_size": self.grid_size,
             "installed": self.installed,
-            "owned": self.owned_programs,  # Now a dict with quantities
+            "owned": dict(self.owned_programs),  # Now a dict with quantities
             "last_run_ok": self.last_run_ok,
         }
     
@@ -357,13 +428,8 @@ class NaviCustomizer:
         
         # Handle both old (list) and new (dict) format for owned programs
         owned = data.get("owned", {"Attack+1": 1, "Speed+1": 1})
-        if isinstance(owned, list):
-            # Convert old list format to dict
-            nc.owned_programs = {}
-            for name in owned:
-                nc.owned_programs[name] = nc.owned_programs.get(name, 0) + 1
-        else:
-            nc.owned_programs = owned
+        # (Counter handles both: a list counts names, a dict copies quantities)
+        nc.owned_programs = Counter(owned)
         
         nc.installed = data.get("installed", [])
         nc.last_run_ok = data.get("last_run_ok", True)
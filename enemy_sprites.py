@@ -3,15 +3,76 @@ Enemy Sprite Manager - Load and manage enemy animations.
 Handles Metaur and other virus sprites with their attacks.
 """
 
+import logging
 import pygame
 import os
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Sequence, Tuple
 from pathlib import Path
+from resources import load_images, list_dir, frame_paths, get_placeholder
+
+log = logging.getLogger(__name__)
+
+# Animation IDs (index into EnemySpriteManager.animations)
+IDLE, ATTACK = range(2)
+
+# Animation names by ID, for logging
+ANIMATION_NAMES = ("idle", "attack")
+
+# Metaur animation frames by ID, loaded on first use
+_METAUR_ANIMATIONS: Dict[int, Tuple[str, ...]] = {
+    IDLE: ("animation_0_frame_0",),                                  # animation_0_frame_0 only
+    ATTACK: tuple(f"animation_1_frame_{i}" for i in range(1, 20)),   # frames 1-19
+}
+
+
+def _find_frame(base_str: str, palette1_str: str, frame_name: str) -> Optional[str]:
+    """Find the file for a frame by name, or None if it doesn't exist."""
+    extensions = [".png", ".webp"]
+    debug = log.isEnabledFor(logging.DEBUG)
+    palette_files = list_dir(palette1_str)
+    root_files = list_dir(base_str)
+    
+    # For Metaur: sprites are in palette1 subfolder
+    # Try palette1 subdirectory FIRST for Metaur
+    for ext in extensions:
+        filename = f"{frame_name}{ext}"
+        if filename in palette_files:
+            return f"{palette1_str}{os.sep}{filename}"
+        if debug:
+            log.debug("Not found: palette1/%s", filename)
+    
+    # Fallback: Try root directory
+    for ext in extensions:
+        filename = f"{frame_name}{ext}"
+        if filename in root_files:
+            return f"{base_str}{os.sep}{filename}"
+        if debug:
+            log.debug("Not found: %s", filename)
+    
+    return None
+
+
+def enemy_frame_paths(enemy_type: str, sprite_base_path: str = "assets/sprites/enemies") -> List[str]:
+    """Every frame file an EnemySpriteManager for this type loads (for preloading)."""
+    if enemy_type != "metaur":
+        return []
+    base_path = Path(sprite_base_path) / enemy_type
+    base_str, palette1_str = os.fspath(base_path), os.fspath(base_path / "palette1")
+    paths = (_find_frame(base_str, palette1_str, name)
+             for names in _METAUR_ANIMATIONS.values() for name in names)
+    return [p for p in paths if p is not None]
 
 
 class EnemySpriteManager:
     """Manages enemy sprite loading and animation playback."""
     
+    __slots__ = (
+        "enemy_type", "base_path", "_base_str", "_palette1_str", "animations",
+        "_pending", "current_animation", "frame_index", "frame_timer",
+        "frame_duration", "_scale_cache", "_current_frames", "_n_frames",
+        "_is_static",
+    )
+    
     def __init__(self, enemy_type: str = "metaur", sprite_base_path: str = "assets/sprites/enemies"):
         """
         Initialize sprite manager.
@@ -23,17 +84,30 @@ class EnemySpriteManager:
         self.enemy_type = enemy_type
         self.base_path = Path(sprite_base_path) / enemy_type
         
-        print(f"[ENEMY SPRITES] Loading {enemy_type} from: {self.base_path.absolute()}")
+        # Plain-string directories for building frame paths in the loaders
+        self._base_str = os.fspath(self.base_path)
+        self._palette1_str = os.fspath(self.base_path / "palette1")
+        
+        log.info("Loading %s from: %s", enemy_type, self.base_path.absolute())
         
-        # Animation states
-        self.animations: Dict[str, List[pygame.Surface]] = {}
-        self.current_animation = "idle"
+        # Animation states (frame lists indexed by animation ID)
+        self.animations: List[Optional[List[pygame.Surface]]] = [None] * len(ANIMATION_NAMES)
+        self._pending: Dict[int, Tuple[str, ...]] = {}  # Not yet loaded, ID -> frame names
+        self.current_animation = IDLE
         self.frame_index = 0
         self.frame_timer = 0.0
         self.frame_duration = 0.1  # seconds per frame
         
+        # Scaled copies of frames, keyed by (id(frame), scale)
+        self._scale_cache: Dict[Tuple[int, float], pygame.Surface] = {}
+        
         # Load animations
         self._load_animations()
+        
+        # Frame list of the current animation, refreshed by set_animation
+        self._current_frames: List[pygame.Surface] = self.animations[self.current_animation] or []
+        self._n_frames = len(self._current_frames)
+        self._is_static = self._n_frames <= 1 or self.frame_duration <= 0
     
     def _load_animations(self):
         """Load all animation frames from directories."""
@@ -43,155 +117,151 @@ class EnemySpriteManager:
             self._load_generic()
     
     def _load_metaur(self):
-        """Load Metaur-specific animations."""
-        print("[ENEMY SPRITES] Loading Metaur animations...")
-        
-        # Idle animation (animation_0_frame_0 only)
-        idle_frame = self._load_frame("animation_0_frame_0")
-        if idle_frame:
-            self.animations["idle"] = [idle_frame]
-            print(f"  [idle] Loaded 1 frame")
-        else:
-            print("  [idle] WARNING: Could not load idle frame!")
-        
-        # Attack animation (animation_1_frame_1 to animation_1_frame_19)
-        attack_frames = []
-        for i in range(1, 20):  # frames 1-19
-            frame = self._load_frame(f"animation_1_frame_{i}")
-            if frame:
-                attack_frames.append(frame)
-        
-        if attack_frames:
-            self.animations["attack"] = attack_frames
-            print(f"  [attack] Loaded {len(attack_frames)} frames")
-        else:
-            print("  [attack] WARNING: No attack frames loaded!")
+        """Set up Metaur animations; only idle is loaded now, the rest on first use."""
+        log.debug("Loading Metaur animations...")
+        self._pending = dict(_METAUR_ANIMATIONS)
         
-        # If no animations loaded, create placeholder
-        if not self.animations:
-            print("  [FALLBACK] Creating placeholder animations")
-            placeholder = pygame.Surface((32, 32), pygame.SRCALPHA)
-            placeholder.fill((180, 140, 60, 200))
-            self.animations["idle"] = [placeholder]
-            self.animations["attack"] = [placeholder]
+        # No idle sprite means the sprites aren't there at all - use placeholders
+        if not self._ensure_loaded(IDLE):
+            log.warning("[FALLBACK] Creating placeholder animations")
+            self._pending.clear()
+            placeholder = get_placeholder((32, 32), (180, 140, 60, 200))
+            self.animations[IDLE] = [placeholder]
+            self.animations[ATTACK] = [placeholder]
+    
+    def _ensure_loaded(self, animation: int) -> bool:
+        """Load an animation's frames if still pending; False if it has none."""
+        frame_names = self._pending.pop(animation, None)
+        if frame_names is not None:
+            frames = self._load_frames(frame_names)
+            name = ANIMATION_NAMES[animation]
+            if frames:
+                self.animations[animation] = frames
+                log.info("[%s] Loaded %d frames", name, len(frames))
+            else:
+                log.warning("[%s] No frames loaded!", name)
+        return self.animations[animation] is not None
+    
+    def preload(self):
+        """Load every animation that is still pending."""
+        for animation in list(self._pending):
+            self._ensure_loaded(animation)
     
     def _load_generic(self):
         """Load generic enemy animations (placeholder)."""
         # For other enemies, create simple placeholder
-        placeholder = pygame.Surface((32, 32), pygame.SRCALPHA)
-        placeholder.fill((180, 140, 60, 200))
-        self.animations["idle"] = [placeholder]
-        self.animations["attack"] = [placeholder]
+        placeholder = get_placeholder((32, 32), (180, 140, 60, 200))
+        self.animations[IDLE] = [placeholder]
+        self.animations[ATTACK] = [placeholder]
     
-    def _load_frame(self, frame_name: str) -> Optional[pygame.Surface]:
-        """Load a single frame by name."""
-        extensions = [".png", ".webp"]
-        
-        # For Metaur: sprites are in palette1 subfolder
-        # Try palette1 subdirectory FIRST for Metaur
-        for ext in extensions:
-            path = self.base_path / "palette1" / f"{frame_name}{ext}"
-            print(f"    Trying: {path}")
-            if path.exists():
-                try:
-                    img = pygame.image.load(str(path)).convert_alpha()
-                    print(f"    ✓ Loaded: palette1/{frame_name}{ext} ({img.get_width()}x{img.get_height()})")
-                    return img
-                except Exception as e:
-                    print(f"    ✗ Failed to load {path}: {e}")
-            else:
-                print(f"    ✗ Not found: {path}")
-        
-        # Fallback: Try root directory
-        for ext in extensions:
-            path = self.base_path / f"{frame_name}{ext}"
-            print(f"    Trying: {path}")
-            if path.exists():
-                try:
-                    img = pygame.image.load(str(path)).convert_alpha()
-                    print(f"    ✓ Loaded: {path} ({img.get_width()}x{img.get_height()})")
-                    return img
-                except Exception as e:
-                    print(f"    ✗ Failed to load {path}: {e}")
-            else:
-                print(f"    ✗ Not found: {path}")
-        
-        return None
+    def _load_frames(self, frame_names: Sequence[str]) -> List[pygame.Surface]:
+        """Load the named frames in one batch, skipping any that are missing."""
+        debug = log.isEnabledFor(logging.DEBUG)
+        paths = [_find_frame(self._base_str, self._palette1_str, name) for name in frame_names]
+        paths = [path for path in paths if path is not None]
+        frames = []
+        for path, img in zip(paths, load_images(paths)):
+            if img is not None:
+                frames.append(img)
+                if debug:
+                    log.debug("Loaded: %s (%dx%d)", path, img.get_width(), img.get_height())
+        return frames
     
     def update(self, dt: float):
         """Update animation frame."""
-        if self.current_animation not in self.animations:
-            return
-        
-        frames = self.animations[self.current_animation]
-        if not frames or len(frames) == 1:
+        if self._is_static:
             return
         
         self.frame_timer += dt
         
-        # Advance frame
-        if self.frame_timer >= self.frame_duration:
-            self.frame_timer = 0.0
-            self.frame_index = (self.frame_index + 1) % len(frames)
+        # Advance one frame per elapsed duration (carry the remainder so
+        # timing doesn't drift, even when a tick spans several frames)
+        frame_duration = self.frame_duration
+        if self.frame_timer >= frame_duration:
+            i = self.frame_index
+            while self.frame_timer >= frame_duration:
+                self.frame_timer -= frame_duration
+                i += 1
+            self.frame_index = i % self._n_frames
     
-    def set_animation(self, animation_name: str):
-        """Switch to a different animation."""
-        if animation_name in self.animations:
-            self.current_animation = animation_name
+    def set_animation(self, animation: int):
+        """Switch to a different animation by ID (IDLE, ATTACK)."""
+        if self._ensure_loaded(animation):
+            self.current_animation = animation
+            self._current_frames = self.animations[animation]
+            self._n_frames = len(self._current_frames)
+            self._is_static = self._n_frames <= 1 or self.frame_duration <= 0
             self.frame_index = 0
             self.frame_timer = 0.0
     
     def play_idle(self):
         """Return to idle animation."""
-        self.set_animation("idle")
+        self.set_animation(IDLE)
     
     def play_attack(self):
         """Trigger attack animation."""
-        self.set_animation("attack")
+        self.set_animation(ATTACK)
     
     def get_current_frame(self) -> Optional[pygame.Surface]:
         """Get the current frame surface for rendering."""
-        if self.current_animation not in self.animations:
+        if not self._n_frames:
             return None
-        
-        frames = self.animations[self.current_animation]
-        if not frames:
-            return None
-        
-        return frames[self.frame_index]
+        return self._current_frames[self.frame_index]
     
-    def draw(self, screen: pygame.Surface, x: int, y: int, 
-             scale: float = 1.0, center: bool = True):
+    def get_blit_pair(self, x: int, y: int, scale: float = 1.0,
+                      center: bool = True) -> Optional[Tuple[pygame.Surface, Tuple[int, int]]]:
         """
-        Draw current animation frame.
+        Get the current frame and its top-left position without drawing it.
         
         Args:
-            screen: Pygame surface to draw on
             x, y: Position
             scale: Scale multiplier
             center: If True, position is center; if False, top-left
         """
         frame = self.get_current_frame()
         if frame is None:
-            return
+            return None
         
-        # Scale if needed
+        # Scale if needed (each frame/scale pair is resampled only once)
         if scale != 1.0:
-            new_size = (int(frame.get_width() * scale), int(frame.get_height() * scale))
-            frame = pygame.transform.scale(frame, new_size)
+            key = (id(frame), scale)
+            scaled = self._scale_cache.get(key)
+            if scaled is None:
+                new_size = (int(frame.get_width() * scale), int(frame.get_height() * scale))
+                scaled = pygame.transform.scale(frame, new_size)
+                self._scale_cache[key] = scaled
+            frame = scaled
         
-        # Position
+        # Position (top-left computed directly, no Rect needed)
         if center:
-            rect = frame.get_rect(center=(x, y))
-        else:
-            rect = frame.get_rect(topleft=(x, y))
+            w, h = frame.get_size()
+            return frame, (x - (w >> 1), y - (h >> 1))
+        return frame, (x, y)
+    
+    def draw(self, screen: pygame.Surface, x: int, y: int, 
+             scale: float = 1.0, center: bool = True):
+        """
+        Draw current animation frame.
         
-        screen.blit(frame, rect)
+        Args:
+            screen: Pygame surface to draw on
+            x, y: Position
+            scale: Scale multiplier
+            center: If True, position is center; if False, top-left
+        """
+        pair = self.get_blit_pair(x, y, scale, center)
+        if pair is not None:
+            screen.blit(*pair)
 
 
 class WaveAttack:
     """Wave attack projectile for Metaur."""
     
+    __slots__ = (
+        "x", "y", "dx", "damage", "alive", "from_enemy", "speed", "hit_radius",
+        "frames", "frame_index", "frame_timer", "frame_duration", "half_sizes",
+    )
+    
     def __init__(self, x: float, y: float, dx: int, damage: int, 
                  sprite_path: str = "assets/sprites/enemies/metaur/attack"):
         """
@@ -218,77 +288,100 @@ class WaveAttack:
         self.frame_timer = 0.0
         self.frame_duration = 0.06  # Slowed down 2x (was 0.03)
         
-        self._load_frames(sprite_path)
+        self.half_sizes: List[Tuple[int, int]] = []  # (w // 2, h // 2) per frame
+        
+        # Every wave shares one processed frame list per sprite path
+        cached = _wave_frames.get(sprite_path)
+        if cached is None:
+            self._load_frames(sprite_path)
+            _wave_frames[sprite_path] = (self.frames, self.half_sizes)
+        else:
+            self.frames, self.half_sizes = cached
     
     def _load_frames(self, sprite_path: str):
         """Load wave animation frames."""
-        base_path = Path(sprite_path)
+        base_path = os.fspath(sprite_path)
+        
+        # Attack folder has frames in ROOT (not palette1), frames 0-5
+        paths = frame_paths(base_path, 0, 6)
+        
+        # Decode every found frame in one batch
+        images = iter(load_images([p for p in paths if p is not None]))
+        for i, path in enumerate(paths):
+            img = next(images) if path is not None else None
+            if img is not None:
+                self.frames.append(img)
+                log.debug("Loaded wave frame %d: %s", i, path)
+            else:
+                # Shared placeholder
+                self.frames.append(get_placeholder((16, 16), (100, 200, 255, 200)))
+                log.warning("Wave frame %d not found at %s, using placeholder", i, base_path)
         
-        for i in range(6):  # frames 0-5
-            loaded = False
-            
-            # Attack folder has frames in ROOT (not palette1)
-            # Try root attack directory
-            for ext in [".png", ".webp"]:
-                path = base_path / f"animation_0_frame_{i}{ext}"
-                if path.exists():
-                    try:
-                        img = pygame.image.load(str(path)).convert_alpha()
-                        self.frames.append(img)
-                        loaded = True
-                        print(f"    ✓ Loaded wave frame {i}: {path}")
-                        break
-                    except Exception as e:
-                        print(f"Failed to load wave frame {i}: {e}")
-            
-            if not loaded:
-                # Create placeholder
-                placeholder = pygame.Surface((16, 16), pygame.SRCALPHA)
-                placeholder.fill((100, 200, 255, 200))
-                self.frames.append(placeholder)
-                print(f"    ✗ Wave frame {i} not found at {base_path}, using placeholder")
+        # Pre-scale to fit grid (smaller than cell) and flip horizontally so
+        # the wave faces left (toward Navi) - done once here, not per draw
+        scale = 0.6
+        self.frames = [
+            pygame.transform.flip(
+                pygame.transform.scale(
+                    frame,
+                    (int(frame.get_width() * scale), int(frame.get_height() * scale))
+                ),
+                True, False
+            )
+            for frame in self.frames
+        ]
+        self.half_sizes = [(f.get_width() >> 1, f.get_height() >> 1) for f in self.frames]
     
     def update(self, dt: float):
         """Update wave position and animation."""
         # Move
         self.x += self.dx * self.speed * dt
         
-        # Animate
+        # Animate (one frame per elapsed duration, remainder carried)
         self.frame_timer += dt
-        if self.frame_timer >= self.frame_duration:
-            self.frame_timer = 0.0
-            self.frame_index = (self.frame_index + 1) % len(self.frames)
+        frame_duration = self.frame_duration
+        if self.frame_timer >= frame_duration and self.frames:
+            i = self.frame_index
+            while self.frame_timer >= frame_duration:
+                self.frame_timer -= frame_duration
+                i += 1
+            self.frame_index = i % len(self.frames)
     
-    def draw(self, screen: pygame.Surface, grid_x: int, grid_y: int, 
-             cell_width: int, cell_height: int, shake_x: int = 0):
-        """Draw the wave attack."""
+    def get_blit_pair(self, grid_x: int, grid_y: int, cell_width: int,
+                      cell_height: int, shake_x: int = 0) -> Optional[Tuple[pygame.Surface, Tuple[int, int]]]:
+        """Get the current frame and its top-left position without drawing it."""
         if not self.frames:
-            return
+            return None
         
         sx = grid_x + int(self.x * cell_width) + shake_x
         sy = grid_y + int(self.y * cell_height) + cell_height // 2
         
-        frame = self.frames[self.frame_index]
-        
-        # Scale to fit grid (smaller than cell)
-        scale = 0.6
-        scaled = pygame.transform.scale(
-            frame, 
-            (int(frame.get_width() * scale), int(frame.get_height() * scale))
-        )
-        
-        # ALWAYS flip horizontally so wave faces left (toward Navi)
-        scaled = pygame.transform.flip(scaled, True, False)
-        
-        rect = scaled.get_rect(center=(sx, sy))
-        screen.blit(scaled, rect)
+        # Frames are pre-scaled and pre-flipped in _load_frames
+        hw, hh = self.half_sizes[self.frame_index]
+        return self.frames[self.frame_index], (sx - hw, sy - hh)
+    
+    def draw(self, screen: pygame.Surface, grid_x: int, grid_y: int, 
+             cell_width: int, cell_height: int, shake_x: int = 0):
+        """Draw the wave attack."""
+        pair = self.get_blit_pair(grid_x, grid_y, cell_width, cell_height, shake_x)
+        if pair is not None:
+            screen.blit(*pair)
 
 
 # Global cache for enemy sprite managers
 _enemy_managers: Dict[str, EnemySpriteManager] = {}
 
+# Global cache for pre-scaled wave frames and their half sizes, keyed by sprite path
+_wave_frames: Dict[str, Tuple[List[pygame.Surface], List[Tuple[int, int]]]] = {}
+
 def get_enemy_sprites(enemy_type: str) -> EnemySpriteManager:
     """Get or create enemy sprite manager for the given type."""
     if enemy_type not in _enemy_managers:
         _enemy_managers[enemy_type] = EnemySpriteManager(enemy_type)
     return _enemy_managers[enemy_type]
+
+
+def update_enemy_sprites(dt: float):
+    """Advance every enemy sprite manager by one tick."""
+    for manager in _enemy_managers.values():
+        manager.update(dt)
@@ -6,8 +6,10 @@ A handheld PET game where nearby WiFi networks become explorable cyber dungeons.
 Main entry point - handles game loop, scene management, and frame limiting.
 """
 
+import logging
 import pygame
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional, Dict, Any
 
 # Import scenes
@@ -20,6 +22,11 @@ from scenes.settings_scene import SettingsScene
 from scenes.jack_in_scene import JackInScene
 from scenes.equipment_scene import EquipmentScene  # Changed from NaviCustScene
 
+# Assets and sprite managers (preloaded behind the splash screen)
+from resources import convert_decoded, decode_assets
+from navi_sprites import get_navi_sprites, navi_frame_paths
+from enemy_sprites import get_enemy_sprites, enemy_frame_paths
+
 # Import core systems
 from storage.save_manager import SaveManager
 from combat.chips import ChipFolder
@@ -42,6 +49,9 @@ CONFIG = {
     "fps_battle": 24,
     "fps_menu": 30,
     
+    # Busy-wait in Clock.tick for steadier battle pacing (costs CPU)
+    "busy_loop_battle": False,
+    
     # Colors (placeholder - will be replaced with sprites)
     "colors": {
         "bg_dark": (15, 15, 25),
@@ -78,6 +88,10 @@ class SceneManager:
         self.current_scene = None
         self.scene_stack = []  # For scenes that return to previous
         
+        # Frame pacing for the current scene, refreshed on every transition
+        self.current_fps = config["fps_menu"]
+        self.busy_loop = False
+        
         # Shared game state
         self.game_state = {
             "navi": {
@@ -148,6 +162,7 @@ class SceneManager:
         # Create new scene
         scene_class = self.scenes[scene_name]
         self.current_scene = scene_class(self, **kwargs)
+        self._update_frame_pacing()
         self.current_scene.on_enter()
     
     def push_scene(self, scene_name: str, **kwargs):
@@ -162,15 +177,24 @@ class SceneManager:
             if self.current_scene:
                 self.current_scene.on_exit()
             self.current_scene = self.scene_stack.pop()
+            self._update_frame_pacing()
             self.current_scene.on_enter()
         else:
             self.change_scene("hub")
     
+    def _update_frame_pacing(self):
+        """Cache the FPS cap and tick mode for the current scene."""
+        if self.current_scene is None:
+            self.current_fps = self.config["fps_menu"]
+            self.busy_loop = False
+        else:
+            self.current_fps = self.current_scene.target_fps
+            self.busy_loop = (self.config["busy_loop_battle"]
+                              and isinstance(self.current_scene, BattleScene))
+    
     def get_fps_for_current_scene(self) -> int:
         """Return appropriate FPS cap for current scene."""
-        if self.current_scene is None:
-            return self.config["fps_menu"]
-        return self.current_scene.target_fps
+        return self.current_fps
     
     def update(self, dt: float):
         """Update current scene."""
@@ -196,15 +220,28 @@ class NetNaviPET:
     """Main game class - handles initialization and game loop."""
     
     def __init__(self):
-        pygame.init()
-        pygame.mixer.init()
+        # Quiet by default; sprite loaders log per-file detail at DEBUG
+        logging.basicConfig(level=logging.WARNING)
+        
+        # Only the modules needed for the first frame; pygame.init() would
+        # also open the audio device, and nothing plays sound yet
+        pygame.display.init()
+        pygame.font.init()
         
         # Set up display
         flags = pygame.FULLSCREEN if CONFIG["fullscreen"] else 0
+        # Ask for a 32-bit surface so convert_alpha()'d sprites already
+        # match the display format and blit without per-pixel conversion
         self.screen = pygame.display.set_mode(
             (CONFIG["screen_width"], CONFIG["screen_height"]), 
-            flags
+            flags,
+            32
         )
+        if self.screen.get_bitsize() != 32:
+            logging.getLogger(__name__).warning(
+                "Display is %d-bit, sprite blits will need format conversion",
+                self.screen.get_bitsize()
+            )
         pygame.display.set_caption("NetNavi PET")
         
         # Hide mouse cursor for handheld feel
@@ -231,16 +268,60 @@ class NetNaviPET:
             pygame.K_ESCAPE: "quit",
         }
         
+        # One reusable action event per mapped key, built once here
+        # instead of allocating a new Event on every keypress
+        self.action_events = {
+            key: pygame.event.Event(pygame.USEREVENT, {"action": action})
+            for key, action in self.input_map.items()
+        }
+        
         self.running = True
     
+    def _preload_sprites(self):
+        """Load assets and sprite managers behind a splash screen so the first battle doesn't stall."""
+        colors = CONFIG["colors"]
+        font = pygame.font.Font(None, 20)
+        small_font = pygame.font.Font(None, 14)
+        title = font.render("NetNavi PET", True, colors["accent_cyan"])
+        title_pos = title.get_rect(center=(CONFIG["screen_width"] // 2, CONFIG["screen_height"] // 2 - 8))
+        loading = [small_font.render("Loading" + "." * n, True, colors["text_dim"]) for n in range(4)]
+        loading_pos = (title_pos.x, title_pos.bottom + 6)
+        
+        # Decode on a worker thread while this thread keeps the window responsive
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            # Only the frames the sprite managers below will load
+            future = pool.submit(lambda: decode_assets(navi_frame_paths() + enemy_frame_paths("metaur")))
+            while not future.done():
+                pygame.event.pump()
+                self.screen.fill(colors["bg_dark"])
+                self.screen.blit(title, title_pos)
+                self.screen.blit(loading[pygame.time.get_ticks() // 250 % 4], loading_pos)
+                pygame.display.flip()
+                pygame.time.wait(16)
+            future.result()
+        
+        # convert_alpha needs the display, so conversion and the sprite
+        # managers built from the converted frames stay on this thread
+        convert_decoded()
+        get_navi_sprites()
+        get_enemy_sprites("metaur").preload()
+    
     def run(self):
         """Main game loop."""
+        self._preload_sprites()
+        
         # Start at hub
         self.scene_manager.change_scene("hub")
+        scene_manager = self.scene_manager
+        clock = self.clock
         
         while self.running:
-            # Get delta time
-            dt = self.clock.tick(self.scene_manager.get_fps_for_current_scene()) / 1000.0
+            # Frame limit (FPS cached on scene change), then delta time
+            if scene_manager.busy_loop:
+                clock.tick_busy_loop(scene_manager.current_fps)
+            else:
+                clock.tick(scene_manager.current_fps)
+            dt = clock.get_time() * 0.001
             
             # Handle events
             for event in pygame.event.get():
@@ -251,26 +332,23 @@ class NetNaviPET:
                         self.running = False
                     else:
                         # Map input and pass to scene
-                        mapped = self.input_map.get(event.key)
-                        if mapped:
-                            mapped_event = pygame.event.Event(
-                                pygame.USEREVENT, 
-                                {"action": mapped}
-                            )
-                            self.scene_manager.handle_event(mapped_event)
+                        mapped_event = self.action_events.get(event.key)
+                        if mapped_event is not None:
+                            scene_manager.handle_event(mapped_event)
                         else:
-                            self.scene_manager.handle_event(event)
+                            scene_manager.handle_event(event)
                 else:
-                    self.scene_manager.handle_event(event)
+                    scene_manager.handle_event(event)
             
             # Update
-            self.scene_manager.update(dt)
+            scene_manager.update(dt)
             
-            # Draw
-            self.screen.fill(CONFIG["colors"]["bg_dark"])
-            self.scene_manager.draw()
+            # Draw (scenes that paint the whole frame clear it themselves)
+            scene = scene_manager.current_scene
+            if scene is None or not scene.clears_screen:
+                self.screen.fill(CONFIG["colors"]["bg_dark"])
+            scene_manager.draw()
             
-            # Flip display
             pygame.display.flip()
         
         # Cleanup
@@ -3,15 +3,82 @@ Navi Sprite Manager - Load and manage Navi battle animations.
 Complete animation system with idle, hurt, movement, attacks, sword, and throwing.
 """
 
+import logging
 import pygame
 import os
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 from pathlib import Path
+from resources import load_images, list_dir, get_placeholder
+
+log = logging.getLogger(__name__)
+
+# Animation IDs (index into NaviSpriteManager.animations)
+IDLE, HURT, MOVE, SWORD, THROW, BUSTER = range(6)
+
+# Animation sources by ID (name, file animation number, frame_count)
+_ANIM_SOURCES = (
+    ("idle", 0, 1),           # Static pose
+    ("hurt", 1, 7),           # Hurt/flinch reaction
+    ("move", 3, 4),           # Movement/walking
+    ("sword", 5, 4),          # Sword attack
+    ("throw", 6, 4),          # Throwing/lob animation
+    ("buster", 8, 8),         # Buster/projectile attack
+)
+
+# Animation names by ID, for logging
+ANIMATION_NAMES = tuple(name for name, _, _ in _ANIM_SOURCES)
+
+# Filename variants to try for each frame by animation ID, built once at import
+_FRAME_NAMES: Tuple[Tuple[Tuple[str, str], ...], ...] = tuple(
+    tuple(
+        (f"animation_{num}_frame_{f}.png", f"animation_{num}_frame_{f}.webp")
+        for f in range(count)
+    )
+    for _, num, count in _ANIM_SOURCES
+)
+
+
+def _resolve_frames(base_str: str) -> List[List[Optional[str]]]:
+    """Each animation's frame files by ID (root directory, then palette1; None where missing)."""
+    # One directory listing each instead of an exists() per candidate
+    palette_str = f"{base_str}{os.sep}palette1"
+    root_files = list_dir(base_str)
+    palette_files = list_dir(palette_str)
+    
+    frame_paths: List[List[Optional[str]]] = []
+    for frame_names in _FRAME_NAMES:
+        paths = []
+        for possible_names in frame_names:
+            path = None
+            for filename in possible_names:
+                if filename in root_files:
+                    path = f"{base_str}{os.sep}{filename}"
+                    break
+            else:
+                for filename in possible_names:
+                    if filename in palette_files:
+                        path = f"{palette_str}{os.sep}{filename}"
+                        break
+            paths.append(path)
+        frame_paths.append(paths)
+    return frame_paths
+
+
+def navi_frame_paths(sprite_base_path: str = "assets/sprites/navi") -> List[str]:
+    """Every frame file a NaviSpriteManager for this path loads (for preloading)."""
+    base_str = os.fspath(Path(sprite_base_path))
+    return [p for paths in _resolve_frames(base_str) for p in paths if p is not None]
 
 
 class NaviSpriteManager:
     """Manages Navi sprite loading and animation playback."""
     
+    __slots__ = (
+        "base_path", "animations", "current_animation", "frame_index",
+        "frame_timer", "frame_duration", "_scale_cache", "_current_frames",
+        "_n_frames", "_current_duration", "_is_static",
+    )
+    
     def __init__(self, sprite_base_path: str = "assets/sprites/navi"):
         """
         Initialize sprite manager.
@@ -21,160 +88,134 @@ class NaviSpriteManager:
         """
         self.base_path = Path(sprite_base_path)
         
-        print(f"[NAVI SPRITES] Loading from: {self.base_path.absolute()}")
+        log.info("Loading from: %s", self.base_path.absolute())
         
-        # Animation states
-        self.animations: Dict[str, List[pygame.Surface]] = {}
-        self.current_animation = "idle"
+        # Animation states (frame lists indexed by animation ID)
+        self.animations: List[Optional[List[pygame.Surface]]] = [None] * len(_ANIM_SOURCES)
+        self.current_animation = IDLE
         self.frame_index = 0
         self.frame_timer = 0.0
         self.frame_duration = 0.1  # seconds per frame (default)
         
+        # Scaled copies of frames, keyed by (id(frame), scale)
+        self._scale_cache: Dict[Tuple[int, float], pygame.Surface] = {}
+        
         # Load animations
         self._load_animations()
+        
+        # Current animation's frames and per-frame duration, refreshed by set_animation
+        self._current_frames: List[pygame.Surface] = self.animations[self.current_animation] or []
+        self._n_frames = len(self._current_frames)
+        self._current_duration = self.frame_duration
+        self._is_static = self._n_frames <= 1 or self._current_duration <= 0
     
     def _load_animations(self):
         """Load all animation frames from directories."""
-        # Define animation sources (name -> animation_id, frame_count)
-        animation_sources = {
-            "idle": (0, 1),           # Static pose
-            "hurt": (1, 7),           # Hurt/flinch reaction
-            "move": (3, 4),           # Movement/walking
-            "sword": (5, 4),          # Sword attack
-            "throw": (6, 4),          # Throwing/lob animation
-            "buster": (8, 8),         # Buster/projectile attack
-        }
+        debug = log.isEnabledFor(logging.DEBUG)
         
-        for anim_name, (anim_num, frame_count) in animation_sources.items():
+        # Resolve every frame's file first (root directory, then palette1)
+        frame_paths = _resolve_frames(os.fspath(self.base_path))
+        
+        # Decode all found frames in one parallel batch
+        images = iter(load_images([p for paths in frame_paths for p in paths if p is not None]))
+        
+        for anim_id, paths in enumerate(frame_paths):
+            anim_name = ANIMATION_NAMES[anim_id]
             frames = []
-            print(f"\n[NAVI SPRITES] Loading {anim_name}...")
+            log.debug("Loading %s...", anim_name)
             
-            for frame_num in range(frame_count):
-                # Generate filename variants to try
-                possible_names = [
-                    f"animation_{anim_num}_frame_{frame_num}.png",
-                    f"animation_{anim_num}_frame_{frame_num}.webp",
-                ]
-                
-                loaded = False
-                
-                # Try root directory first
-                for filename in possible_names:
-                    path = self.base_path / filename
-                    
-                    if path.exists():
-                        try:
-                            img = pygame.image.load(str(path)).convert_alpha()
-                            frames.append(img)
-                            loaded = True
-                            print(f"  ✓ Frame {frame_num}: {filename} ({img.get_width()}x{img.get_height()})")
-                            break
-                        except Exception as e:
-                            print(f"  ✗ Failed to load {filename}: {e}")
-                            continue
-                
-                # Try palette1 subdirectory
-                if not loaded:
-                    for filename in possible_names:
-                        path = self.base_path / "palette1" / filename
-                        
-                        if path.exists():
-                            try:
-                                img = pygame.image.load(str(path)).convert_alpha()
-                                frames.append(img)
-                                loaded = True
-                                print(f"  ✓ Frame {frame_num}: palette1/{filename} ({img.get_width()}x{img.get_height()})")
-                                break
-                            except Exception as e:
-                                print(f"  ✗ Failed to load palette1/{filename}: {e}")
-                                continue
-                
-                if not loaded:
+            for frame_num, path in enumerate(paths):
+                img = next(images) if path is not None else None
+                if img is not None:
+                    frames.append(img)
+                    if debug:
+                        log.debug("Frame %d: %s (%dx%d)", frame_num, path, img.get_width(), img.get_height())
+                else:
                     # Create placeholder if file not found
-                    placeholder = pygame.Surface((84, 84), pygame.SRCALPHA)
-                    placeholder.fill((255, 0, 255, 128))  # Magenta = missing
-                    frames.append(placeholder)
-                    print(f"  ✗ MISSING: Frame {frame_num} (no file found)")
+                    frames.append(get_placeholder((84, 84), (255, 0, 255, 128)))  # Magenta = missing
+                    log.warning("[%s] MISSING: Frame %d (no file found)", anim_name, frame_num)
             
             if frames:
-                self.animations[anim_name] = frames
-                print(f"  [{anim_name}] Loaded {len(frames)} frames")
+                self.animations[anim_id] = frames
+                log.info("[%s] Loaded %d frames", anim_name, len(frames))
     
     def update(self, dt: float):
         """Update animation frame. Call this every game frame."""
-        if self.current_animation not in self.animations:
+        if self._is_static:
             return
         
-        frames = self.animations[self.current_animation]
-        if not frames:
-            return
-        
-        # Use faster frame duration for buster animation
-        frame_duration = self.frame_duration
-        if self.current_animation == "buster":
-            frame_duration = 0.025  # 4x faster than original (0.1s), 2x faster than previous (0.05s)
-        
         self.frame_timer += dt
         
-        # Advance frame when timer exceeds duration
+        # Advance one frame per elapsed duration, carrying the remainder, so
+        # animations shorter than a tick skip frames instead of lagging behind
+        frame_duration = self._current_duration
         if self.frame_timer >= frame_duration:
-            self.frame_timer = 0.0
-            self.frame_index += 1
+            i = self.frame_index
+            while self.frame_timer >= frame_duration:
+                self.frame_timer -= frame_duration
+                i += 1
             
             # Loop animation
-            if self.frame_index >= len(frames):
-                self.frame_index = 0
+            self.frame_index = i % self._n_frames
     
-    def set_animation(self, animation_name: str, loop: bool = True):
+    def set_animation(self, animation: int, loop: bool = True):
         """
         Switch to a different animation.
         
         Args:
-            animation_name: Name of animation (e.g., "idle", "hurt", "buster")
+            animation: Animation ID (e.g., IDLE, HURT, BUSTER)
             loop: Whether animation should loop
         """
-        if animation_name in self.animations:
-            if self.current_animation != animation_name:
-                print(f"[NAVI SPRITES] Switching to: {animation_name}")
-            self.current_animation = animation_name
+        frames = self.animations[animation]
+        if frames is not None:
+            if self.current_animation != animation:
+                log.debug("Switching to: %s", ANIMATION_NAMES[animation])
+            self.current_animation = animation
+            self._current_frames = frames
+            self._n_frames = len(frames)
+            
+            # Use faster frame duration for buster animation
+            if animation == BUSTER:
+                self._current_duration = 0.025  # 4x faster than original (0.1s), 2x faster than previous (0.05s)
+            else:
+                self._current_duration = self.frame_duration
+            
+            # Single-frame poses never advance, so update() can skip them
+            self._is_static = self._n_frames <= 1 or self._current_duration <= 0
+            
             self.frame_index = 0
             self.frame_timer = 0.0
     
     # Animation shortcuts
     def play_idle(self):
         """Return to idle animation."""
-        self.set_animation("idle")
+        self.set_animation(IDLE)
     
     def play_hurt(self):
         """Trigger hurt/flinch animation."""
-        self.set_animation("hurt")
+        self.set_animation(HURT)
     
     def play_move(self):
         """Trigger movement animation."""
-        self.set_animation("move")
+        self.set_animation(MOVE)
     
     def play_sword(self):
         """Trigger sword attack animation."""
-        self.set_animation("sword")
+        self.set_animation(SWORD)
     
     def play_throw(self):
         """Trigger throwing/lob animation."""
-        self.set_animation("throw")
+        self.set_animation(THROW)
     
     def play_buster(self):
         """Trigger buster/projectile attack animation."""
-        self.set_animation("buster")
+        self.set_animation(BUSTER)
     
     def get_current_frame(self) -> Optional[pygame.Surface]:
         """Get the current frame surface for rendering."""
-        if self.current_animation not in self.animations:
+        if self.frame_index >= self._n_frames:
             return None
-        
-        frames = self.animations[self.current_animation]
-        if not frames or self.frame_index >= len(frames):
-            return None
-        
-        return frames[self.frame_index]
+        return self._current_frames[self.frame_index]
     
     def draw(self, screen: pygame.Surface, x: int, y: int, 
              scale: float = 1.0, center: bool = True):
@@ -191,18 +232,22 @@ class NaviSpriteManager:
         if frame is None:
             return
         
-        # Scale if needed
+        # Scale if needed (each frame/scale pair is resampled only once)
         if scale != 1.0:
-            new_size = (int(frame.get_width() * scale), int(frame.get_height() * scale))
-            frame = pygame.transform.scale(frame, new_size)
+            key = (id(frame), scale)
+            scaled = self._scale_cache.get(key)
+            if scaled is None:
+                new_size = (int(frame.get_width() * scale), int(frame.get_height() * scale))
+                scaled = pygame.transform.scale(frame, new_size)
+                self._scale_cache[key] = scaled
+            frame = scaled
         
-        # Position
+        # Position (top-left computed directly, no Rect needed)
         if center:
-            rect = frame.get_rect(center=(x, y))
+            w, h = frame.get_size()
+            screen.blit(frame, (x - (w >> 1), y - (h >> 1)))
         else:
-            rect = frame.get_rect(topleft=(x, y))
-        
-        screen.blit(frame, rect)
+            screen.blit(frame, (x, y))
 
 
 # Convenience function for lazy loading
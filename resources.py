@@ -1,3 +1,274 @@
-# Content from document index 7 - keep original
-# This file was in the documents but not modified
-pass
+"""
+Resources - Shared asset loading with a process-wide surface cache.
+Sprite managers load through here so each PNG is decoded only once.
+"""
+
+import logging
+import mmap
+import os
+import re
+import struct
+import threading
+import pygame
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, FrozenSet, List, Optional, Sequence, Tuple
+
+log = logging.getLogger(__name__)
+
+# Pre-decoded sprites written by tools/bake_sprites.py: one pack per
+# directory holding every image's raw RGBA rows. Layout (little-endian):
+# magic + entry count, then per entry a name length, the UTF-8 file name
+# and (width, height, data offset), then the pixel data
+PACK_NAME = "sprites.pack"
+PACK_MAGIC = b"NNPK"
+PACK_HEADER = struct.Struct("<4sI")
+PACK_NAME_LEN = struct.Struct("<H")
+PACK_ENTRY = struct.Struct("<IIQ")
+
+# Decoder threads for batch loads (libpng releases the GIL while decoding)
+_LOAD_WORKERS = 4
+
+
+# Converted surfaces keyed by path string
+_SURFACE_CACHE: Dict[str, pygame.Surface] = {}
+
+
+def load_image(path: str) -> pygame.Surface:
+    """Load an image with per-pixel alpha, reusing the cached surface if loaded before."""
+    surface = _SURFACE_CACHE.get(path)
+    if surface is None:
+        surface = _read_image(path).convert_alpha()
+        _SURFACE_CACHE[path] = surface
+    return surface
+
+
+# Resized copies keyed by (path, (width, height))
+_SCALED_CACHE: Dict[Tuple[str, Tuple[int, int]], pygame.Surface] = {}
+
+
+def load_image_scaled(path: str, size: Tuple[int, int]) -> pygame.Surface:
+    """Load an image resized to size, derived from the cached unscaled surface."""
+    key = (path, size)
+    surface = _SCALED_CACHE.get(key)
+    if surface is None:
+        surface = pygame.transform.scale(load_image(path), size)
+        _SCALED_CACHE[key] = surface
+    return surface
+
+
+# Opened packs keyed by directory: (mapped file, name -> (w, h, offset)),
+# or None when the directory has no usable pack
+_PACKS: Dict[str, Optional[Tuple[mmap.mmap, Dict[str, Tuple[int, int, int]]]]] = {}
+_PACKS_LOCK = threading.Lock()
+
+
+def read_pack(path: str) -> Tuple[mmap.mmap, Dict[str, Tuple[int, int, int]]]:
+    """Map a sprite pack and read its index (raises OSError/ValueError/struct.error if bad)."""
+    with open(path, "rb") as f:
+        data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    magic, count = PACK_HEADER.unpack_from(data)
+    if magic != PACK_MAGIC:
+        raise ValueError("bad magic")
+    index = {}
+    pos = PACK_HEADER.size
+    for _ in range(count):
+        (name_len,) = PACK_NAME_LEN.unpack_from(data, pos)
+        pos += PACK_NAME_LEN.size
+        name = data[pos:pos + name_len].decode("utf-8")
+        pos += name_len
+        index[name] = PACK_ENTRY.unpack_from(data, pos)
+        pos += PACK_ENTRY.size
+    return data, index
+
+
+def pack_frame_names(files) -> List[str]:
+    """The PNG frame files a directory's pack should hold, sorted."""
+    return sorted(n for n in files if n.lower().endswith(".png") and _FRAME_RE.match(n))
+
+
+def _open_pack(directory: str):
+    """Map a directory's sprite pack and read its index (None if missing, stale or bad)."""
+    files = list_dir(directory)
+    if PACK_NAME not in files:
+        return None
+    try:
+        # A PNG edited after the last bake wins over the pack
+        path = os.path.join(directory, PACK_NAME)
+        pack_time = os.path.getmtime(path)
+        for name in pack_frame_names(files):
+            if os.path.getmtime(os.path.join(directory, name)) > pack_time:
+                log.warning("Ignoring stale sprite pack in %s (re-run tools/bake_sprites.py)", directory)
+                return None
+        return read_pack(path)
+    except (OSError, ValueError, struct.error) as e:
+        log.warning("Ignoring sprite pack in %s: %s", directory, e)
+        return None
+
+
+def _load_baked(path: str) -> Optional[pygame.Surface]:
+    """Load an image's pre-decoded pixels from its directory's pack, if baked."""
+    directory, name = os.path.split(path)
+    directory = os.path.normpath(directory or ".")
+    with _PACKS_LOCK:
+        if directory not in _PACKS:
+            _PACKS[directory] = _open_pack(directory)
+        pack = _PACKS[directory]
+    if pack is None:
+        return None
+    
+    data, index = pack
+    entry = index.get(name)
+    if entry is None:
+        return None
+    width, height, offset = entry
+    size = width * height * 4
+    if offset + size > len(data):
+        log.warning("Ignoring truncated baked sprite for %s", path)
+        return None
+    return pygame.image.frombuffer(memoryview(data)[offset:offset + size], (width, height), "RGBA")
+
+
+def _read_image(path: str) -> pygame.Surface:
+    """Read an image unconverted, preferring its baked pixels over the PNG."""
+    surface = _load_baked(path)
+    if surface is None:
+        surface = pygame.image.load(path)
+    return surface
+
+
+def _decode(path: str) -> Optional[pygame.Surface]:
+    """Decode an image file without converting it; None if it can't be read."""
+    try:
+        return _read_image(path)
+    except (pygame.error, OSError) as e:
+        log.warning("Failed to load %s: %s", path, e)
+        return None
+
+
+def _decode_all(paths: Sequence[str]) -> List[Optional[pygame.Surface]]:
+    """Decode several images, in parallel when there is more than one."""
+    if len(paths) > 1:
+        with ThreadPoolExecutor(max_workers=_LOAD_WORKERS) as pool:
+            return list(pool.map(_decode, paths))
+    return [_decode(p) for p in paths]
+
+
+def load_images(paths: Sequence[str]) -> List[Optional[pygame.Surface]]:
+    """Load several images at once, decoding uncached ones in parallel (None for failures).
+    
+    Converts on the calling thread, so call it from the main (display) thread.
+    """
+    missing = [p for p in dict.fromkeys(paths) if p not in _SURFACE_CACHE]
+    for path, raw in zip(missing, _decode_all(missing)):
+        if raw is not None:
+            _SURFACE_CACHE[path] = raw.convert_alpha()
+    
+    return [_SURFACE_CACHE.get(p) for p in paths]
+
+
+# Directory listings keyed by path string
+_DIR_CACHE: Dict[str, FrozenSet[str]] = {}
+
+
+def list_dir(path) -> FrozenSet[str]:
+    """Return the file names in a directory (empty if missing), scanning it only once."""
+    key = os.path.normpath(os.fspath(path))
+    names = _DIR_CACHE.get(key)
+    if names is None:
+        try:
+            with os.scandir(key) as entries:
+                names = frozenset(e.name for e in entries if e.is_file())
+        except OSError:
+            names = frozenset()
+        _DIR_CACHE[key] = names
+    return names
+
+
+# Sprite frame files: animation_<anim>_frame_<index>.<ext>
+_FRAME_RE = re.compile(r"animation_(\d+)_frame_(\d+)\.(png|webp)$", re.I)
+
+# Preferred extension wins when a frame exists in both formats
+_EXT_RANK = {"png": 0, "webp": 1}
+
+
+def frame_paths(directory, animation: int, frame_count: int) -> List[Optional[str]]:
+    """Paths of an animation's frames 0..frame_count-1 from one listing (None where missing)."""
+    directory = os.fspath(directory)
+    found: List[Optional[Tuple[int, str]]] = [None] * frame_count
+    for name in list_dir(directory):
+        m = _FRAME_RE.match(name)
+        if m is None or int(m.group(1)) != animation:
+            continue
+        index = int(m.group(2))
+        rank = _EXT_RANK[m.group(3).lower()]
+        if index < frame_count and (found[index] is None or rank < found[index][0]):
+            found[index] = (rank, name)
+    return [None if f is None else f"{directory}{os.sep}{f[1]}" for f in found]
+
+
+def scan_tree(root) -> None:
+    """Cache the listing of root and every directory below it, one scandir per directory."""
+    stack = [os.path.normpath(os.fspath(root))]
+    while stack:
+        directory = stack.pop()
+        files = []
+        try:
+            with os.scandir(directory) as entries:
+                for e in entries:
+                    if e.is_dir():
+                        stack.append(os.path.join(directory, e.name))
+                    elif e.is_file():
+                        files.append(e.name)
+        except OSError:
+            pass
+        _DIR_CACHE[directory] = frozenset(files)
+
+
+# Images the first scenes need, decoded during the startup splash
+PRELOAD_IMAGES = (
+    "assets/Mugshot/mugshot.png",
+)
+
+
+# Decoded but not yet converted surfaces from decode_assets(), keyed by path
+_RAW_CACHE: Dict[str, pygame.Surface] = {}
+
+
+def decode_assets(paths: Sequence[str] = (), root: str = "assets") -> None:
+    """Scan every asset listing and decode PRELOAD_IMAGES plus paths, unconverted (thread-safe)."""
+    scan_tree(root)
+    paths = [p for p in PRELOAD_IMAGES if os.path.basename(p) in list_dir(os.path.dirname(p))] + list(paths)
+    paths = [p for p in dict.fromkeys(paths) if p not in _SURFACE_CACHE and p not in _RAW_CACHE]
+    for path, raw in zip(paths, _decode_all(paths)):
+        if raw is not None:
+            _RAW_CACHE[path] = raw
+
+
+def convert_decoded() -> None:
+    """Convert everything decode_assets() decoded into the surface cache (main thread only)."""
+    while _RAW_CACHE:
+        path, raw = _RAW_CACHE.popitem()
+        _SURFACE_CACHE[path] = raw.convert_alpha()
+
+
+def preload_all(root: str = "assets"):
+    """decode_assets then convert_decoded, for callers already on the main thread."""
+    decode_assets(root=root)
+    convert_decoded()
+
+
+# Solid-color placeholders keyed by (size, color)
+_PLACEHOLDER_CACHE: Dict[Tuple[Tuple[int, int], Tuple[int, ...]], pygame.Surface] = {}
+
+
+def get_placeholder(size: Tuple[int, int], color: Tuple[int, ...]) -> pygame.Surface:
+    """Return a shared, display-converted placeholder surface (do not draw on it)."""
+    key = (size, color)
+    surface = _PLACEHOLDER_CACHE.get(key)
+    if surface is None:
+        surface = pygame.Surface(size, pygame.SRCALPHA)
+        surface.fill(color)
+        if pygame.display.get_surface() is not None:
+            surface = surface.convert_alpha()
+        _PLACEHOLDER_CACHE[key] = surface
+    return surface
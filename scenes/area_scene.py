@@ -13,6 +13,7 @@ class AreaScene(BaseScene):
     """Isometric area exploration with auto-wandering Navi."""
     
     target_fps = 20
+    clears_screen = True
     
     TILE_FLOOR = 0
     TILE_WALL = 1
@@ -33,7 +34,21 @@ class AreaScene(BaseScene):
         seed = self.area.get("seed", random.randint(0, 99999))
         self.rng = random.Random(seed)
         self.map_data = self._generate_map()
-        self.items = self._place_items()
+        self.items = self._place_items()  # (x, y) -> [x, y, reward], in placement order
+        
+        # Tile geometry never changes after generation, so build it once
+        # (flat, indexed by gy * map_width + gx)
+        self._grid_screen = [
+            self._grid_to_screen(x, y)
+            for y in range(self.map_height)
+            for x in range(self.map_width)
+        ]
+        tw, th = self.tile_width // 2, self.tile_height // 2
+        self._tile_points = [
+            ((sx, sy - th), (sx + tw, sy), (sx, sy + th), (sx - tw, sy))
+            for sx, sy in self._grid_screen
+        ]
+        self._build_map_surface()
         
         # Navi position
         self.navi_x, self.navi_y = 1, 1
@@ -55,58 +70,123 @@ class AreaScene(BaseScene):
         # Item popup display
         self.item_popup = None  # {"text": "Got 50z!", "timer": 2.0}
         
+        # HUD labels, rebuilt only when the counts they show change
+        self._ui_counts = None
+        self._name_label = self.area.get("display_name", "Area")[:12]
+        self._wins_label = ""
+        self._steps_label = ""
+        
         # State
         self.state = "exploring"
         self.flash_timer = 0.0
         self.anim_timer = 0.0
+        
+        # Item diamonds pre-rendered for every spin width
+        self._item_sprites = self._build_item_sprites()
+        
+        # Full-screen white overlay for the encounter flash (alpha set per frame)
+        self._flash_surface = pygame.Surface((self.width, self.height)).convert()
+        self._flash_surface.fill((255, 255, 255))
     
     def _generate_map(self):
-        tiles = [[self.TILE_FLOOR] * self.map_width for _ in range(self.map_height)]
+        """Build the map as a flat bytearray, one byte per tile (index y * map_width + x)."""
+        w, h = self.map_width, self.map_height
+        tiles = bytearray([self.TILE_FLOOR]) * (w * h)
         
-        # Borders
-        for x in range(self.map_width):
-            tiles[0][x] = self.TILE_WALL
-            tiles[self.map_height-1][x] = self.TILE_WALL
-        for y in range(self.map_height):
-            tiles[y][0] = self.TILE_WALL
-            tiles[y][self.map_width-1] = self.TILE_WALL
+        # Borders (top/bottom rows, then left/right columns as strided slices)
+        wall = bytes([self.TILE_WALL])
+        tiles[:w] = wall * w
+        tiles[(h-1) * w:] = wall * w
+        tiles[::w] = wall * h
+        tiles[w-1::w] = wall * h
         
         # Random walls
         for _ in range(self.rng.randint(5, 10)):
-            x, y = self.rng.randint(2, self.map_width-3), self.rng.randint(2, self.map_height-3)
-            tiles[y][x] = self.TILE_WALL
+            x, y = self.rng.randint(2, w-3), self.rng.randint(2, h-3)
+            tiles[y * w + x] = self.TILE_WALL
         
         # Danger zones
         for _ in range(self.rng.randint(4, 8)):
-            x, y = self.rng.randint(2, self.map_width-3), self.rng.randint(2, self.map_height-3)
-            if tiles[y][x] == self.TILE_FLOOR:
-                tiles[y][x] = self.TILE_DANGER
+            x, y = self.rng.randint(2, w-3), self.rng.randint(2, h-3)
+            if tiles[y * w + x] == self.TILE_FLOOR:
+                tiles[y * w + x] = self.TILE_DANGER
         
         # Exit
-        tiles[self.map_height-2][self.map_width-2] = self.TILE_EXIT
-        tiles[1][1] = self.TILE_FLOOR
+        tiles[(h-2) * w + w-2] = self.TILE_EXIT
+        tiles[1 * w + 1] = self.TILE_FLOOR
         
         return tiles
     
     def _place_items(self):
-        items = []
+        items = {}
         for _ in range(self.rng.randint(3, 5)):
             for _ in range(20):
                 x, y = self.rng.randint(2, self.map_width-3), self.rng.randint(2, self.map_height-3)
-                if self.map_data[y][x] == self.TILE_FLOOR:
-                    if not any(i[0] == x and i[1] == y for i in items):
-                        items.append([x, y, self.rng.choice(["zenny", "hp"])])
+                if self.map_data[y * self.map_width + x] == self.TILE_FLOOR:
+                    if (x, y) not in items:
+                        items[x, y] = [x, y, self.rng.choice(["zenny", "hp"])]
                         break
         return items
     
+    def _build_map_surface(self):
+        """Rasterize background and static tiles once; danger tiles stay dynamic."""
+        self._map_surface = pygame.Surface((self.width, self.height)).convert()
+        self._map_surface.fill((20, 25, 35))
+        # (gx, pts, overlay, overlay position) for tiles redrawn every frame
+        self._danger_tiles = []
+        
+        static = []  # (index, color, pts, bounds) in draw order
+        danger = []  # (index, gx, pts, bounds)
+        for idx, pts in enumerate(self._tile_points):
+            gx, gy = idx % self.map_width, idx // self.map_width
+            xs = [x for x, _ in pts]
+            ys = [y for _, y in pts]
+            bounds = pygame.Rect(min(xs), min(ys), max(xs) - min(xs) + 1, max(ys) - min(ys) + 1)
+            color = self._tile_base_color(self.map_data[idx], gx, gy)
+            if color is None:
+                danger.append((idx, gx, pts, bounds))
+                continue
+            static.append((idx, color, pts, bounds))
+            pygame.draw.polygon(self._map_surface, color, pts)
+            pygame.draw.polygon(self._map_surface, (70, 75, 90), pts, 1)
+        
+        # Tiles are painted in row order, so static tiles after a danger tile
+        # cover its shared edges; each danger tile gets an overlay of those
+        # later neighbours to blit over it after its pulse is drawn
+        for d_idx, gx, pts, bounds in danger:
+            later = [(color, tile_pts) for idx, color, tile_pts, b in static
+                     if idx > d_idx and b.colliderect(bounds)]
+            overlay = None
+            if later:
+                overlay = pygame.Surface(bounds.size, pygame.SRCALPHA)
+                ox, oy = bounds.topleft
+                for color, tile_pts in later:
+                    local = [(x - ox, y - oy) for x, y in tile_pts]
+                    pygame.draw.polygon(overlay, color, local)
+                    pygame.draw.polygon(overlay, (70, 75, 90), local, 1)
+                overlay = overlay.convert_alpha()
+            self._danger_tiles.append((gx, pts, overlay, bounds.topleft))
+    
+    def _build_item_sprites(self):
+        """Render item diamonds keyed by (reward, half-width 2-6)."""
+        sprites = {}
+        for reward, color in (("zenny", (255, 220, 50)), ("hp", (80, 255, 120))):
+            for hw in range(2, 7):
+                surf = pygame.Surface((hw * 2 + 1, 15), pygame.SRCALPHA)
+                pygame.draw.polygon(surf, color, [(hw, 0), (hw * 2, 8), (hw, 14), (0, 8)])
+                sprites[reward, hw] = surf.convert_alpha()
+        return sprites
+    
     def _grid_to_screen(self, gx, gy):
+        # Integer tiles use the precomputed self._grid_screen; this is for
+        # building it and for the Navi's interpolated position
         ix = (gx - gy) * (self.tile_width // 2) + self.width // 2
         iy = (gx + gy) * (self.tile_height // 2) + 30
         return ix, iy
     
     def _is_walkable(self, x, y):
         if 0 <= x < self.map_width and 0 <= y < self.map_height:
-            return self.map_data[y][x] != self.TILE_WALL
+            return self.map_data[y * self.map_width + x] != self.TILE_WALL
         return False
     
     def update(self, dt):
@@ -145,16 +225,10 @@ class AreaScene(BaseScene):
         """Navi AI prioritizes: 1) Collect items, 2) Head to exit if done, 3) Explore."""
         # Priority 1: Go to nearest item
         if self.items:
-            nearest = None
-            nearest_d = 999
-            for ix, iy, _ in self.items:
-                d = abs(ix - self.navi_x) + abs(iy - self.navi_y)
-                if d < nearest_d:
-                    nearest_d, nearest = d, (ix, iy)
-            
-            if nearest:
-                self._move_toward(nearest[0], nearest[1])
-                return
+            nx, ny = self.navi_x, self.navi_y
+            nearest = min(self.items.values(), key=lambda item: abs(item[0] - nx) + abs(item[1] - ny))
+            self._move_toward(nearest[0], nearest[1])
+            return
         
         # Priority 2: Head to exit if boss defeated or enough battles won
         if self.boss_defeated or self.battles_won >= 3:
@@ -194,13 +268,12 @@ class AreaScene(BaseScene):
         self.total_steps += 1
         self._check_step_hp_regen()
         
-        # Collect items
-        for item in self.items[:]:
-            if item[0] == self.navi_x and item[1] == self.navi_y:
-                self._collect(item)
-                self.items.remove(item)
+        # Collect items (at most one per tile)
+        item = self.items.pop((self.navi_x, self.navi_y), None)
+        if item is not None:
+            self._collect(item)
         
-        tile = self.map_data[self.navi_y][self.navi_x]
+        tile = self.map_data[self.navi_y * self.map_width + self.navi_x]
         
         # Exit check
         if tile == self.TILE_EXIT and (self.boss_defeated or self.battles_won >= 3):
@@ -297,16 +370,18 @@ class AreaScene(BaseScene):
             self.manager.change_scene("hub")
     
     def draw(self, screen):
-        # Background
-        screen.fill((20, 25, 35))
-        
-        # Tiles
-        for y in range(self.map_height):
-            for x in range(self.map_width):
-                self._draw_tile(screen, x, y)
+        # Background and static tiles (pre-rendered), then pulsing danger tiles
+        screen.blit(self._map_surface, (0, 0))
+        t = self.anim_timer * 2
+        for gx, pts, overlay, pos in self._danger_tiles:
+            pulse = (math.sin(t + gx) + 1) * 0.5
+            pygame.draw.polygon(screen, (70 + int(pulse * 30), 40, 40), pts)
+            pygame.draw.polygon(screen, (70, 75, 90), pts, 1)
+            if overlay is not None:
+                screen.blit(overlay, pos)
         
         # Items
-        for ix, iy, reward in self.items:
+        for ix, iy, reward in self.items.values():
             self._draw_item(screen, ix, iy, reward)
         
         # Navi
@@ -317,39 +392,28 @@ class AreaScene(BaseScene):
         
         # Flash
         if self.state == "flash":
-            s = pygame.Surface((self.width, self.height))
-            s.fill((255, 255, 255))
-            s.set_alpha(int(180 * (self.flash_timer / 0.4)))
-            screen.blit(s, (0, 0))
+            self._flash_surface.set_alpha(int(180 * (self.flash_timer / 0.4)))
+            screen.blit(self._flash_surface, (0, 0))
     
-    def _draw_tile(self, screen, gx, gy):
-        tile = self.map_data[gy][gx]
-        sx, sy = self._grid_to_screen(gx, gy)
-        tw, th = self.tile_width // 2, self.tile_height // 2
-        
+    def _tile_base_color(self, tile, gx, gy):
+        """Fixed color for a tile, or None for danger tiles (they pulse)."""
         if tile == self.TILE_WALL:
-            color = (50, 55, 70)
+            return (50, 55, 70)
         elif tile == self.TILE_EXIT:
-            color = (80, 180, 220)
+            return (80, 180, 220)
         elif tile == self.TILE_DANGER:
-            pulse = (math.sin(self.anim_timer * 2 + gx) + 1) / 2
-            color = (70 + int(pulse * 30), 40, 40)
+            return None
         else:
-            color = (35 + (gx + gy) % 10, 45 + (gx + gy) % 10, 60 + (gx + gy) % 10)
-        
-        pts = [(sx, sy - th), (sx + tw, sy), (sx, sy + th), (sx - tw, sy)]
-        pygame.draw.polygon(screen, color, pts)
-        pygame.draw.polygon(screen, (70, 75, 90), pts, 1)
+            return (35 + (gx + gy) % 10, 45 + (gx + gy) % 10, 60 + (gx + gy) % 10)
     
     def _draw_item(self, screen, gx, gy, reward):
-        sx, sy = self._grid_to_screen(gx, gy)
+        sx, sy = self._grid_screen[gy * self.map_width + gx]
         bob = math.sin(self.anim_timer * 3 + gx) * 2
         spin = abs(math.sin(self.anim_timer * 2 + gx * 0.3))
         hw = int(4 * spin + 2)
         
-        color = (255, 220, 50) if reward == "zenny" else (80, 255, 120)
-        pts = [(sx, sy - 8 - bob), (sx + hw, sy - bob), (sx, sy + 6 - bob), (sx - hw, sy - bob)]
-        pygame.draw.polygon(screen, color, pts)
+        sprite = self._item_sprites["zenny" if reward == "zenny" else "hp", hw]
+        screen.blit(sprite, (sx - hw, int(sy - 8 - bob)))
     
     def _draw_navi(self, screen):
         sx, sy = self._grid_to_screen(self.visual_x, self.visual_y)
@@ -362,12 +426,17 @@ class AreaScene(BaseScene):
     
     def _draw_ui(self, screen):
         navi = self.game_state["navi"]
+        counts = (self.battles_won, self.total_steps)
+        if counts != self._ui_counts:
+            self._ui_counts = counts
+            self._wins_label = f"W:{self.battles_won}"
+            self._steps_label = f"Steps:{self.total_steps}/1000"
+        
         self.draw_panel(screen, 2, 2, 90, 16, border_width=1)
-        name = self.area.get("display_name", "Area")[:12]
-        self.draw_text(screen, name, 5, 3, size=11, color=self.colors["accent_cyan"])
+        self.draw_text(screen, self._name_label, 5, 3, size=11, color=self.colors["accent_cyan"])
         
         self.draw_progress_bar(screen, 2, 20, 50, 6, navi["hp"], navi["max_hp"])
-        self.draw_text(screen, f"W:{self.battles_won}", 2, 30, size=10, color=self.colors["text_dim"])
+        self.draw_text(screen, self._wins_label, 2, 30, size=10, color=self.colors["text_dim"])
         
         # Item popup (centered, prominent)
         if self.item_popup:
@@ -379,5 +448,5 @@ class AreaScene(BaseScene):
                           size=16, center=True, color=self.colors["hp_green"])
         
         # Step counter
-        self.draw_text(screen, f"Steps:{self.total_steps}/1000", 2, self.height - 12,
+        self.draw_text(screen, self._steps_label, 2, self.height - 12,
                       size=9, color=self.colors["text_dim"])
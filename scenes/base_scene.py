@@ -9,11 +9,21 @@ if TYPE_CHECKING:
     from main import SceneManager
 
 
+# Max rendered text surfaces kept per scene (least recently used evicted)
+TEXT_CACHE_SIZE = 256
+
+
 class BaseScene:
     """Abstract base class for all game scenes."""
     
     # Override in subclasses
     target_fps = 30
+    # True if draw() paints (or deliberately keeps) every pixel, so the main
+    # loop skips its background fill
+    clears_screen = False
+    
+    # Fonts shared by every scene, keyed by (font name, size)
+    _FONT_CACHE: Dict[tuple, pygame.font.Font] = {}
     
     def __init__(self, manager: "SceneManager"):
         self.manager = manager
@@ -21,19 +31,32 @@ class BaseScene:
         self.game_state = manager.game_state
         self.colors = self.config["colors"]
         
+        # Palette entries the draw helpers use every frame, resolved once
+        c = self.colors
+        self._c_white = c["text_white"]
+        self._c_dim = c["text_dim"]
+        self._c_cyan = c["accent_cyan"]
+        self._c_panel = c["bg_panel"]
+        self._c_green = c["hp_green"]
+        self._c_yellow = c["hp_yellow"]
+        self._c_red = c["hp_red"]
+        
         # Screen dimensions
         self.width = self.config["screen_width"]
         self.height = self.config["screen_height"]
         
-        # Common fonts (created lazily)
-        self._fonts = {}
+        # Rendered text surfaces keyed by (text, size, color), least recently used first
+        self._text_cache: Dict[tuple, pygame.Surface] = {}
     
-    def get_font(self, size: int) -> pygame.font.Font:
-        """Get or create a font of the specified size."""
-        if size not in self._fonts:
+    def get_font(self, size: int, name: str = None) -> pygame.font.Font:
+        """Get or create a font of the specified size (default font if no name)."""
+        key = (name, size)
+        font = BaseScene._FONT_CACHE.get(key)
+        if font is None:
             # Use default font for now - replace with custom font path later
-            self._fonts[size] = pygame.font.Font(None, size)
-        return self._fonts[size]
+            font = pygame.font.Font(name, size)
+            BaseScene._FONT_CACHE[key] = font
+        return font
     
     def on_enter(self):
         """Called when scene becomes active."""
@@ -59,18 +82,29 @@ class BaseScene:
     # DRAWING HELPERS
     # =========================================================================
     
+    def get_text(self, text: str, size: int = 20, color=None) -> pygame.Surface:
+        """Get the rendered surface for text, rasterizing it only on a cache miss."""
+        if color is None:
+            color = self._c_white
+        
+        key = (text, size, color)
+        cache = self._text_cache
+        surface = cache.pop(key, None)
+        if surface is None:
+            surface = self.get_font(size).render(text, True, color).convert_alpha()
+            if len(cache) >= TEXT_CACHE_SIZE:
+                del cache[next(iter(cache))]
+        cache[key] = surface  # (Re)insert as most recently used
+        return surface
+    
     def draw_text(self, screen: pygame.Surface, text: str, x: int, y: int, 
                   color=None, size: int = 20, center: bool = False):
         """Draw text with optional centering."""
-        if color is None:
-            color = self.colors["text_white"]
-        
-        font = self.get_font(size)
-        surface = font.render(text, True, color)
+        surface = self.get_text(text, size, color)
         
         if center:
-            rect = surface.get_rect(center=(x, y))
-            screen.blit(surface, rect)
+            w, h = surface.get_size()
+            screen.blit(surface, (x - (w >> 1), y - (h >> 1)))
         else:
             screen.blit(surface, (x, y))
         
@@ -81,9 +115,9 @@ class BaseScene:
                    border_width: int = 2):
         """Draw a UI panel with optional border."""
         if color is None:
-            color = self.colors["bg_panel"]
+            color = self._c_panel
         if border_color is None:
-            border_color = self.colors["accent_cyan"]
+            border_color = self._c_cyan
         
         # Background
         pygame.draw.rect(screen, color, (x, y, width, height))
@@ -99,17 +133,11 @@ class BaseScene:
         if bg_color is None:
             bg_color = (30, 30, 40)
         if border_color is None:
-            border_color = self.colors["text_dim"]
+            border_color = self._c_dim
         
         # Determine fill color based on percentage if not specified
         if fill_color is None:
-            pct = value / max_value if max_value > 0 else 0
-            if pct > 0.5:
-                fill_color = self.colors["hp_green"]
-            elif pct > 0.25:
-                fill_color = self.colors["hp_yellow"]
-            else:
-                fill_color = self.colors["hp_red"]
+            fill_color = self.bar_color(value / max_value if max_value > 0 else 0)
         
         # Background
         pygame.draw.rect(screen, bg_color, (x, y, width, height))
@@ -122,11 +150,28 @@ class BaseScene:
         # Border
         pygame.draw.rect(screen, border_color, (x, y, width, height), 1)
     
+    def bar_color(self, pct: float):
+        """Health-style fill color for a bar at pct full (green, yellow, red)."""
+        if pct > 0.5:
+            return self._c_green
+        if pct > 0.25:
+            return self._c_yellow
+        return self._c_red
+    
+    def draw_batch(self, screen: pygame.Surface, blits):
+        """Blit a list of (surface, (x, y)) pairs in one call."""
+        if not blits:
+            return
+        if hasattr(screen, "fblits"):
+            screen.fblits(blits)  # pygame-ce
+        else:
+            screen.blits(blits, doreturn=False)
+    
     def draw_placeholder_sprite(self, screen: pygame.Surface, x: int, y: int,
                                  width: int, height: int, color, label: str = ""):
         """Draw a colored rectangle as placeholder for sprites."""
         pygame.draw.rect(screen, color, (x, y, width, height))
-        pygame.draw.rect(screen, self.colors["text_white"], (x, y, width, height), 1)
+        pygame.draw.rect(screen, self._c_white, (x, y, width, height), 1)
         
         if label:
             self.draw_text(screen, label, x + width // 2, y + height // 2,
@@ -136,7 +181,7 @@ class BaseScene:
                            radius: int, color, label: str = ""):
         """Draw a colored circle as placeholder for sprites."""
         pygame.draw.circle(screen, color, (x, y), radius)
-        pygame.draw.circle(screen, self.colors["text_white"], (x, y), radius, 2)
+        pygame.draw.circle(screen, self._c_white, (x, y), radius, 2)
         
         if label:
             self.draw_text(screen, label, x, y, size=12, center=True)
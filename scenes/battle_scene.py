@@ -6,17 +6,131 @@ This version adds BN-style chip behaviors and Metaur virus with wave attack.
 """
 
 import pygame
+import copy
+import heapq
+import itertools
 import math
 import random
+from functools import lru_cache
+from types import MappingProxyType
 from scenes.base_scene import BaseScene
-from combat.chips import Chip, CHIP_DATABASE, roll_chip_drop
+from combat.chips import CHIP_DATABASE, roll_chip_drop
 from combat.equipment import roll_equipment_drop  # NEW: Equipment drops
-from navi_sprites import get_navi_sprites
-from enemy_sprites import get_enemy_sprites, WaveAttack
+from navi_sprites import get_navi_sprites, HURT, MOVE, BUSTER
+from enemy_sprites import get_enemy_sprites, update_enemy_sprites, WaveAttack
+
+# Bound methods of the shared generator for the per-tick AI rolls
+# (still follow random.seed)
+_random = random.random
+_uniform = random.uniform
+
+# Sine table for the shake and bob wobble: _SIN_LUT[int(a * _SIN_STEPS) & 255] ~ sin(a)
+_SIN_LUT = tuple(math.sin(i * 2 * math.pi / 256) for i in range(256))
+_SIN_STEPS = 256 / (2 * math.pi)
+
+# Tiles hit by a lobbed chip's impact, as offsets from the target tile
+SPLASH_OFFSETS = {
+    "single": ((0, 0),),
+    "cross1": ((0, 0), (-1, 0), (1, 0), (0, -1), (0, 1)),
+    "cross2": ((0, 0), (-1, 0), (1, 0), (0, -1), (0, 1), (-2, 0), (2, 0), (0, -2), (0, 2)),
+    "square1": tuple((dx, dy) for dx in (-1, 0, 1) for dy in (-1, 0, 1)),
+}
+
+
+@lru_cache(maxsize=None)
+def _splash_tiles(gx, gy, splash, cols, rows):
+    """In-bounds tiles hit by an impact at (gx, gy), worked out once per tile and splash."""
+    offsets = SPLASH_OFFSETS.get(splash, SPLASH_OFFSETS["single"])
+    return tuple(
+        (gx + dx, gy + dy) for dx, dy in offsets
+        if 0 <= gx + dx < cols and 0 <= gy + dy < rows
+    )
+
+
+# Row Navi dodges to, keyed by (danger row, current row): the nearest other
+# row, preferring the upper one on a tie
+_DODGE_ROW = {
+    (danger, row): min((r for r in range(3) if r != danger), key=lambda r: abs(r - row))
+    for danger in range(3) for row in range(3)
+}
+
+# Shared read-only chip params, so firing a chip doesn't allocate dicts
+_NO_PARAMS = MappingProxyType({})
+_MINIBOMB_PARAMS = MappingProxyType({"dist": 3, "delay": 0.45, "splash": "single"})
+_BOMB_PARAMS = MappingProxyType({"dist": 3, "delay": 0.5, "splash": "cross1"})
+_SPREADER_PARAMS = MappingProxyType({"diagonals": True})
+_AIRSHOT_PARAMS = MappingProxyType({"push": 1})
+
+# Chip behavior and forced params by lowercase chip name; names not listed
+# are matched by substring once, then remembered here
+_BEHAVIOR_BY_NAME = {
+    "minibomb": ("lob", _MINIBOMB_PARAMS),
+    "spreader": ("spreader", _SPREADER_PARAMS),
+    "shotgun": ("shotgun", _NO_PARAMS),
+    "airshot": ("airshot", _AIRSHOT_PARAMS),
+    "air shot": ("airshot", _AIRSHOT_PARAMS),
+}
+
+
+def _match_behavior(name):
+    """Infer (behavior, forced params) from keywords in a lowercase chip name."""
+    if "bomb" in name:
+        if "mini" in name:
+            return "lob", _MINIBOMB_PARAMS
+        return "lob", _BOMB_PARAMS
+    if "spreader" in name:
+        return "spreader", _SPREADER_PARAMS
+    if "shotgun" in name:
+        return "shotgun", _NO_PARAMS
+    if "airshot" in name or "air shot" in name:
+        return "airshot", _AIRSHOT_PARAMS
+    return "projectile", _NO_PARAMS
+
+
+# Pre-drawn disc sprites keyed by their (color, radius, width) circle layers
+_DISC_CACHE = {}
+
+
+def _disc_sprite(layers):
+    """Circles drawn in order around one center, rendered once (blit at center - radius)."""
+    surface = _DISC_CACHE.get(layers)
+    if surface is None:
+        r = max(radius for _, radius, _ in layers)
+        surface = pygame.Surface((2 * r + 1, 2 * r + 1), pygame.SRCALPHA)
+        for color, radius, width in layers:
+            pygame.draw.circle(surface, color, (r, r), radius, width)
+        surface = surface.convert_alpha()
+        _DISC_CACHE[layers] = surface
+    return surface
+
+
+def _compact_alive(items, dropped=None):
+    """Drop items whose alive flag is False, in place and keeping order.
+
+    Dropped items are appended to the dropped list when one is given.
+    """
+    write = 0
+    for item in items:
+        if item.alive:
+            items[write] = item
+            write += 1
+        elif dropped is not None:
+            dropped.append(item)
+    del items[write:]
+
 
 class Projectile:
-    """A moving projectile on the battle grid."""
-    def __init__(
+    """A moving projectile on the battle grid (recycled through BattleScene's pool)."""
+
+    __slots__ = (
+        "x", "y", "dx", "dy", "vx", "vy", "damage", "color", "from_enemy",
+        "alive", "speed", "pierce", "on_hit", "hit_radius", "hit_radius_sq",
+    )
+
+    def __init__(self, *args, **kwargs):
+        self.reset(*args, **kwargs)
+
+    def reset(
         self,
         x, y, dx, dy,
         damage,
@@ -27,8 +141,11 @@ class Projectile:
         on_hit=None,
         hit_radius=0.6
     ):
+        """(Re)initialize every field, so a dead projectile can be reused."""
         self.x, self.y = float(x), float(y)
         self.dx, self.dy = dx, dy
+        # Velocity in tiles per second, so a step is one multiply per axis
+        self.vx, self.vy = dx * speed, dy * speed
         self.damage = damage
         self.color = color
         self.from_enemy = from_enemy
@@ -37,10 +154,14 @@ class Projectile:
         self.pierce = pierce
         self.on_hit = on_hit
         self.hit_radius = hit_radius
+        self.hit_radius_sq = hit_radius * hit_radius
 
 
 class SlashEffect:
     """Visual effect for sword attacks."""
+
+    __slots__ = ("positions", "color", "timer", "max_time")
+
     def __init__(self, positions, color, duration=0.3):
         self.positions = positions
         self.color = color
@@ -50,19 +171,29 @@ class SlashEffect:
 
 class ImpactEffect:
     """Delayed impact for lobbed chips (bombs)."""
+
+    __slots__ = ("gx", "gy", "damage", "color", "delay", "expires", "splash", "on_impact")
+
     def __init__(self, gx, gy, damage, color, delay=0.45, splash=None, on_impact=None):
         self.gx = gx
         self.gy = gy
         self.damage = damage
         self.color = color
-        self.timer = delay
+        self.delay = delay
+        self.expires = delay  # Scene time it lands, set when scheduled
         self.splash = splash
         self.on_impact = on_impact
-        self.alive = True
 
 
 class Enemy:
     """An enemy virus in battle."""
+
+    __slots__ = (
+        "name", "hp", "max_hp", "attack", "defense", "x", "y", "is_boss",
+        "attack_timer", "move_timer", "alive", "attack_cooldown",
+        "is_attacking", "attack_anim_timer", "sprite_manager",
+    )
+
     def __init__(self, name, hp, attack, defense, x, y, is_boss=False):
         self.name = name
         self.hp = hp
@@ -91,6 +222,7 @@ class BattleScene(BaseScene):
     """Grid-based battle with custom screen chip selection."""
 
     target_fps = 24
+    clears_screen = True
 
     def __init__(self, manager, enemy: dict = None, area: dict = None, **kwargs):
         super().__init__(manager)
@@ -98,10 +230,15 @@ class BattleScene(BaseScene):
         
         # Apply equipment bonuses to Navi stats
         self._apply_equipment_bonuses()
+        # Navi stats dict, updated in place for the whole battle
+        self._navi = self.game_state["navi"]
         
         # Sprite manager for Navi animations
         self.navi_sprites = get_navi_sprites()
         self.navi_sprites.play_idle()
+        # Bound once; the buster timer and idle return call these every few frames
+        self._set_navi_anim = self.navi_sprites.set_animation
+        self._play_navi_idle = self.navi_sprites.play_idle
 
         # Grid: 3 rows x 6 cols (smaller cells for 128x128)
         self.grid_cols = 6
@@ -111,9 +248,23 @@ class BattleScene(BaseScene):
         self.grid_x = (self.width - self.grid_cols * self.cell_width) // 2
         self.grid_y = 30  # Adjusted for smaller screen
 
+        # Screen center of every grid cell, keyed by (gx, gy)
+        self._cell_centers = {
+            (gx, gy): (self.grid_x + gx * self.cell_width + self.cell_width // 2,
+                       self.grid_y + gy * self.cell_height + self.cell_height // 2)
+            for gx in range(self.grid_cols) for gy in range(self.grid_rows)
+        }
+        self._build_grid_surface()
+        self._build_hud_frames()
+
         # Spawn 1-3 enemies
         self.enemies = self._spawn_enemies(enemy)
 
+        # Living enemies keyed by grid tile, kept in step with moves and deaths
+        self._tile_index = {(e.x, e.y): e for e in self.enemies}
+        # Living enemies in spawn order; dead ones are dropped in _enemy_hit
+        self._alive_enemies = list(self.enemies)
+
         # Navi state
         self.navi_x, self.navi_y = 1, 1
         self.navi_move_timer = 0.0
@@ -125,19 +276,38 @@ class BattleScene(BaseScene):
 
         # Projectiles and effects
         self.projectiles = []
+        self._projectile_pool = []  # Dead projectiles, reused by _spawn_projectile
         self.wave_attacks = []  # Separate list for Metaur wave attacks
         self.slash_effects = []
-        self.impact_effects = []
+        # Pending bomb impacts as a heap of (expiry time, sequence, impact),
+        # timed against anim_timer
+        self._impact_heap = []
+        self._impact_seq = itertools.count()
 
         # Custom screen / chip system
         self.custom_gauge = 0.0
         self.custom_gauge_max = 15.0
         self.in_custom_screen = False
         self.drawn_chips = []
-        self.selected_chips = []
+        self.selected_slots = []  # Indices into drawn_chips, in selection order
         self.chip_cursor = 0
         self.chip_queue = []
 
+        self._custom_bg = None  # Overlay and title, built on first open
+        self._overlays = {}  # Win/lose dimming layers keyed by RGBA color
+        self._enemy_bodies = {}  # Placeholder (sprite, radius) keyed by is_boss
+        for e in self.enemies:
+            if not e.sprite_manager:
+                self._enemy_body(e.is_boss)
+        self._card_panels = {}  # Custom screen card backgrounds keyed by is_selected
+        # Attack chip handlers by behavior; anything else fires a plain projectile
+        self._chip_handlers = {
+            "lob": self._use_lob_chip,
+            "spreader": self._fire_spreader,
+            "shotgun": self._fire_shotgun,
+            "airshot": self._fire_airshot,
+        }
+
         # Battle state
         self.phase = "intro"
         self.phase_timer = 1.0
@@ -154,6 +324,59 @@ class BattleScene(BaseScene):
         self.rewards = {"zenny": 0, "chips": []}
         self.battle_result = None
 
+    def _build_hud_frames(self):
+        """Render the HP panel and custom gauge backgrounds and borders once."""
+        self._hp_frame = pygame.Surface((35, 10)).convert()
+        self.draw_panel(self._hp_frame, 0, 0, 35, 10, border_width=1)
+        self.draw_progress_bar(self._hp_frame, 1, 1, 30, 4, 0, 1)
+
+        bar_w = self.width - 4
+        self._gauge_frame = pygame.Surface((bar_w, 4)).convert()
+        self._gauge_frame.fill((30, 30, 50))
+        pygame.draw.rect(self._gauge_frame, (100, 100, 120), (0, 0, bar_w, 4), 1)
+
+        # HUD composites and the values they were last rendered for
+        self._hud_status = pygame.Surface((self.width // 2, 20), pygame.SRCALPHA).convert_alpha()
+        self._hud_status_key = None
+        self._hud_gauge = pygame.Surface((self.width, 6), pygame.SRCALPHA).convert_alpha()
+        self._hud_gauge_key = None
+        self._virus_count = None
+        self._virus_label = None
+
+        # Enemy HP bars (12x2), one per filled width 0..12
+        self._hp_bars = []
+        for fill_w in range(13):
+            bar = pygame.Surface((12, 2)).convert()
+            bar.fill((40, 20, 20))
+            bar.fill((220, 60, 60), (0, 0, fill_w, 2))
+            self._hp_bars.append(bar)
+
+    def _build_grid_surface(self):
+        """Rasterize the static panel grid once; draw() just blits it."""
+        cw, ch = self.cell_width, self.cell_height
+        self._grid_surface = pygame.Surface((self.grid_cols * cw, self.grid_rows * ch)).convert()
+        surf = self._grid_surface
+        # Cell outlines: every pixel the panel fills below don't cover
+        surf.fill((80, 80, 100))
+
+        for row in range(self.grid_rows):
+            for col in range(self.grid_cols):
+                x = col * cw
+                y = row * ch
+
+                if col < 3:
+                    panel_color = (40, 80, 160)
+                    panel_light = (60, 110, 200)
+                    panel_dark = (25, 50, 110)
+                else:
+                    panel_color = (160, 50, 60)
+                    panel_light = (200, 70, 80)
+                    panel_dark = (110, 30, 40)
+
+                surf.fill(panel_color, (x+1, y+1, cw-2, ch-2))
+                surf.fill(panel_light, (x+1, y+1, cw-2, 1))
+                surf.fill(panel_dark, (x+1, y+ch-2, cw-2, 1))
+
     def _spawn_enemies(self, enemy_data):
         enemies = []
         enemy_data = enemy_data or {}
@@ -239,20 +462,29 @@ class BattleScene(BaseScene):
         # Timers
         self.navi_invis_timer = max(0.0, self.navi_invis_timer - dt)
 
-        # Update damage popups
-        for p in self.damage_popups[:]:
+        # Update damage popups (expired ones compacted out in place)
+        popups = self.damage_popups
+        write = 0
+        for p in popups:
             p[3] -= dt
-            if p[3] <= 0:
-                self.damage_popups.remove(p)
+            if p[3] > 0:
+                popups[write] = p
+                write += 1
+        del popups[write:]
 
         # Update slash effects
-        for s in self.slash_effects[:]:
+        slashes = self.slash_effects
+        write = 0
+        for s in slashes:
             s.timer -= dt
-            if s.timer <= 0:
-                self.slash_effects.remove(s)
+            if s.timer > 0:
+                slashes[write] = s
+                write += 1
+        del slashes[write:]
 
         # Update bomb impacts
-        self._update_impacts(dt)
+        if self._impact_heap:
+            self._update_impacts()
 
         # Update enemy attack animations
         for enemy in self.enemies:
@@ -280,8 +512,10 @@ class BattleScene(BaseScene):
             self.phase_timer -= dt
 
     def _update_battle(self, dt):
-        self._update_projectiles(dt)
-        self._update_wave_attacks(dt)
+        if self.projectiles:
+            self._update_projectiles(dt)
+        if self.wave_attacks:
+            self._update_wave_attacks(dt)
         self._update_navi(dt)
         self._update_enemies(dt)
 
@@ -290,87 +524,105 @@ class BattleScene(BaseScene):
 
         # Return to idle animation
         if self.hit_flash <= 0 and self.navi_invis_timer <= 0:
-            if self.navi_sprites.current_animation in ["hurt", "move"]:
-                self.navi_sprites.play_idle()
+            if self.navi_sprites.current_animation in (HURT, MOVE):
+                self._play_navi_idle()
 
-        if all(not e.alive for e in self.enemies):
+        if not self._alive_enemies:
             self._win()
-        elif self.game_state["navi"]["hp"] <= 0:
+        elif self._navi["hp"] <= 0:
             self._lose()
 
-    def _update_impacts(self, dt):
-        for imp in self.impact_effects[:]:
-            imp.timer -= dt
-            if imp.timer <= 0 and imp.alive:
-                imp.alive = False
-                self._resolve_impact(imp)
-                if imp.on_impact:
-                    try:
-                        imp.on_impact(imp.gx, imp.gy)
-                    except Exception:
-                        pass
-
-        self.impact_effects = [i for i in self.impact_effects if i.alive]
+    def _schedule_impact(self, imp: ImpactEffect):
+        imp.expires = self.anim_timer + imp.delay
+        heapq.heappush(self._impact_heap, (imp.expires, next(self._impact_seq), imp))
+
+    def _update_impacts(self):
+        # Only impacts due by now are touched; the rest wait in expiry order
+        heap = self._impact_heap
+        while heap and heap[0][0] <= self.anim_timer:
+            imp = heapq.heappop(heap)[2]
+            self._resolve_impact(imp)
+            if imp.on_impact:
+                try:
+                    imp.on_impact(imp.gx, imp.gy)
+                except Exception:
+                    pass
 
     def _resolve_impact(self, imp: ImpactEffect):
-        hit_tiles = [(imp.gx, imp.gy)]
-        if imp.splash == "cross1":
-            hit_tiles += [(imp.gx - 1, imp.gy), (imp.gx + 1, imp.gy), (imp.gx, imp.gy - 1), (imp.gx, imp.gy + 1)]
-        elif imp.splash == "cross2":
-            for r in (1, 2):
-                hit_tiles += [(imp.gx - r, imp.gy), (imp.gx + r, imp.gy), (imp.gx, imp.gy - r), (imp.gx, imp.gy + r)]
-        elif imp.splash == "square1":
-            for dx in (-1, 0, 1):
-                for dy in (-1, 0, 1):
-                    hit_tiles.append((imp.gx + dx, imp.gy + dy))
-
-        for tx, ty in hit_tiles:
-            if not (0 <= tx < self.grid_cols and 0 <= ty < self.grid_rows):
-                continue
-            for enemy in self.enemies:
-                if enemy.alive and enemy.x == tx and enemy.y == ty:
-                    self._enemy_hit(enemy, imp.damage)
+        tile_index = self._tile_index
+        for tile in _splash_tiles(imp.gx, imp.gy, imp.splash, self.grid_cols, self.grid_rows):
+            enemy = tile_index.get(tile)
+            if enemy is not None:
+                self._enemy_hit(enemy, imp.damage)
 
         sx, sy = self._grid_to_screen(imp.gx, imp.gy)
         self.damage_popups.append([sx, sy - 10, "BOOM", 0.6, imp.color])
         self.shake = max(self.shake, 0.5)
 
     def _update_projectiles(self, dt):
-        for proj in self.projectiles[:]:
-            proj.x += proj.dx * proj.speed * dt
-            proj.y += proj.dy * proj.speed * dt
+        tile_index = self._tile_index
+        max_x, max_y = self.grid_cols, self.grid_rows
+        navi_x, navi_y = self.navi_x, self.navi_y
+        for proj in self.projectiles:
+            x = proj.x + proj.vx * dt
+            y = proj.y + proj.vy * dt
+            proj.x, proj.y = x, y
 
-            if proj.x < -1 or proj.x > self.grid_cols or proj.y < -1 or proj.y > self.grid_rows:
+            if x < -1 or x > max_x or y < -1 or y > max_y:
                 proj.alive = False
                 continue
 
+            r_sq = proj.hit_radius_sq
+
             # Enemy projectile hits Navi
-            if proj.from_enemy and proj.alive:
-                if abs(proj.x - self.navi_x) < proj.hit_radius and abs(proj.y - self.navi_y) < proj.hit_radius:
+            if proj.from_enemy:
+                dx = x - navi_x
+                dy = y - navi_y
+                if dx * dx + dy * dy < r_sq:
                     self._navi_hit(proj.damage)
                     proj.alive = False
+                continue
 
-            # Navi projectile hits enemies
-            if not proj.from_enemy and proj.alive:
-                for enemy in self.enemies:
-                    if enemy.alive and abs(proj.x - enemy.x) < proj.hit_radius and abs(proj.y - enemy.y) < proj.hit_radius:
-                        self._enemy_hit(enemy, proj.damage)
-
-                        if proj.on_hit:
-                            try:
-                                proj.on_hit(enemy, enemy.x, enemy.y)
-                            except Exception:
-                                pass
+            # Navi projectile hits enemies (nearest column first, then the
+            # neighbouring one, since hit_radius can reach past half a tile)
+            ty = int(round(y))
+            dy = y - ty
+            dy_sq = dy * dy
+            nx = int(round(x))
+            for tx in (nx, nx + 1 if x > nx else nx - 1):
+                enemy = tile_index.get((tx, ty))
+                if enemy is None:
+                    continue
+                dx = x - tx
+                if dx * dx + dy_sq < r_sq:
+                    self._enemy_hit(enemy, proj.damage)
+
+                    if proj.on_hit:
+                        try:
+                            proj.on_hit(enemy, enemy.x, enemy.y)
+                        except Exception:
+                            pass
+
+                    if not proj.pierce:
+                        proj.alive = False
+                    break
 
-                        if not proj.pierce:
-                            proj.alive = False
-                        break
+        _compact_alive(self.projectiles, self._projectile_pool)
 
-        self.projectiles = [p for p in self.projectiles if p.alive]
+    def _spawn_projectile(self, *args, **kwargs):
+        """Launch a projectile (Projectile arguments), reusing a dead one when available."""
+        pool = self._projectile_pool
+        if pool:
+            proj = pool.pop()
+            proj.reset(*args, **kwargs)
+        else:
+            proj = Projectile(*args, **kwargs)
+        self.projectiles.append(proj)
+        return proj
 
     def _update_wave_attacks(self, dt):
         """Update Metaur wave attacks separately."""
-        for wave in self.wave_attacks[:]:
+        for wave in self.wave_attacks:
             wave.update(dt)
 
             # Check bounds
@@ -383,7 +635,7 @@ class BattleScene(BaseScene):
                 self._navi_hit(wave.damage)
                 wave.alive = False
 
-        self.wave_attacks = [w for w in self.wave_attacks if w.alive]
+        _compact_alive(self.wave_attacks)
 
     def _update_navi(self, dt):
         # Movement
@@ -399,45 +651,44 @@ class BattleScene(BaseScene):
             self._fire_buster()
 
     def _navi_ai_move(self):
+        navi_y = self.navi_y
         danger_row = None
         for proj in self.projectiles:
-            if proj.from_enemy and proj.dx < 0 and 0 < proj.x < 3.5:
-                if abs(proj.y - self.navi_y) < 0.6:
-                    danger_row = int(round(proj.y))
-                    break
-
-        # Also check wave attacks
-        if danger_row is None:
+            if proj.from_enemy and proj.dx < 0 and 0 < proj.x < 3.5 and abs(proj.y - navi_y) < 0.6:
+                danger_row = int(round(proj.y))
+                break
+        else:
+            # Also check wave attacks
             for wave in self.wave_attacks:
-                if wave.dx < 0 and 0 < wave.x < 3.5:
-                    if abs(wave.y - self.navi_y) < 0.6:
-                        danger_row = int(round(wave.y))
-                        break
+                if wave.dx < 0 and 0 < wave.x < 3.5 and abs(wave.y - navi_y) < 0.6:
+                    danger_row = int(round(wave.y))
+                    break
 
         if danger_row is not None:
-            safe = [r for r in range(3) if r != danger_row]
-            if safe:
-                safe.sort(key=lambda r: abs(r - self.navi_y))
-                self.navi_y = safe[0]
-                self.navi_sprites.play_move()
-                return
+            self.navi_y = _DODGE_ROW[(danger_row, navi_y)]
+            self.navi_sprites.play_move()
+            return
 
-        if random.random() < 0.3:
-            if random.random() < 0.7:
+        if _random() < 0.3:
+            if _random() < 0.7:
                 self.navi_y = random.randint(0, 2)
                 self.navi_sprites.play_move()
             else:
-                self.navi_x = max(0, min(2, self.navi_x + random.choice([-1, 1])))
+                self.navi_x = max(0, min(2, self.navi_x + random.choice((-1, 1))))
                 self.navi_sprites.play_move()
 
+    def _ensure_anim(self, animation):
+        """Switch Navi to animation unless it is already playing (no restart)."""
+        if self.navi_sprites.current_animation != animation:
+            self._set_navi_anim(animation)
+
     def _fire_buster(self):
-        navi = self.game_state["navi"]
+        navi = self._navi
         buster_attack = navi.get("buster_attack", 1)
         
-        if self.navi_sprites.current_animation != "buster":
-            self.navi_sprites.play_buster()
+        self._ensure_anim(BUSTER)
 
-        proj = Projectile(
+        self._spawn_projectile(
             self.navi_x + 0.5, self.navi_y,
             1, 0,
             buster_attack,
@@ -445,16 +696,15 @@ class BattleScene(BaseScene):
             from_enemy=False,
             speed=8.0
         )
-        self.projectiles.append(proj)
 
     # Chip usage methods (same as before but with shorter code)
     def _use_chip(self, chip):
         """Use a battle chip with BN-style behavior resolution."""
         if getattr(chip, "chip_type", "") == "heal":
-            navi = self.game_state["navi"]
+            navi = self._navi
             navi["hp"] = min(navi["max_hp"], navi["hp"] + chip.power)
             sx, sy = self._grid_to_screen(self.navi_x, self.navi_y)
-            self.damage_popups.append([sx, sy - 10, f"+{chip.power}", 1.0, self.colors["hp_green"]])
+            self.damage_popups.append([sx, sy - 10, f"+{chip.power}", 1.0, self._c_green])
             return
 
         if self._chip_is_invis(chip):
@@ -467,21 +717,12 @@ class BattleScene(BaseScene):
 
         if getattr(chip, "chip_type", "") == "attack":
             behavior = getattr(chip, "behavior", None)
-            params = getattr(chip, "params", {}) or {}
+            params = getattr(chip, "params", None) or _NO_PARAMS
 
             if behavior is None:
                 behavior, params = self._infer_behavior_from_name(chip, params)
 
-            if behavior == "lob":
-                self._use_lob_chip(chip, params)
-            elif behavior == "spreader":
-                self._fire_spreader(chip, params)
-            elif behavior == "shotgun":
-                self._fire_shotgun(chip, params)
-            elif behavior == "airshot":
-                self._fire_airshot(chip, params)
-            else:
-                self._fire_chip_projectile(chip, params)
+            self._chip_handlers.get(behavior, self._fire_chip_projectile)(chip, params)
             return
 
     def _chip_is_invis(self, chip) -> bool:
@@ -492,26 +733,24 @@ class BattleScene(BaseScene):
 
     def _infer_behavior_from_name(self, chip, params):
         name = (chip.name or "").lower()
-        if "bomb" in name:
-            if "mini" in name:
-                return "lob", {**params, "dist": 3, "delay": 0.45, "splash": "single"}
-            return "lob", {**params, "dist": 3, "delay": 0.5, "splash": "cross1"}
-        if "spreader" in name:
-            return "spreader", {**params, "diagonals": True}
-        if "shotgun" in name:
-            return "shotgun", params
-        if "airshot" in name or "air shot" in name:
-            return "airshot", {**params, "push": 1}
-        return "projectile", params
+        entry = _BEHAVIOR_BY_NAME.get(name)
+        if entry is None:
+            entry = _BEHAVIOR_BY_NAME[name] = _match_behavior(name)
+        behavior, overrides = entry
+        if not overrides:
+            return behavior, params
+        if not params:
+            return behavior, overrides
+        return behavior, {**params, **overrides}
 
     def _apply_invis(self, chip):
         dur = 3.0
-        params = getattr(chip, "params", {}) or {}
+        params = getattr(chip, "params", None) or _NO_PARAMS
         if "duration" in params:
             dur = float(params["duration"])
         self.navi_invis_timer = max(self.navi_invis_timer, dur)
         sx, sy = self._grid_to_screen(self.navi_x, self.navi_y)
-        self.damage_popups.append([sx, sy - 12, "INVIS", 0.8, self.colors["accent_cyan"]])
+        self.damage_popups.append([sx, sy - 12, "INVIS", 0.8, self._c_cyan])
 
     def _use_lob_chip(self, chip, params):
         self.navi_sprites.play_throw()
@@ -520,42 +759,36 @@ class BattleScene(BaseScene):
         splash = params.get("splash", "single")
         gx = min(self.grid_cols - 1, self.navi_x + dist)
         gy = int(self.navi_y)
-        imp = ImpactEffect(gx, gy, damage=chip.power, color=self.colors["accent_cyan"], delay=delay, splash=splash)
-        self.impact_effects.append(imp)
+        imp = ImpactEffect(gx, gy, damage=chip.power, color=self._c_cyan, delay=delay, splash=splash)
+        self._schedule_impact(imp)
 
     def _fire_chip_projectile(self, chip, params=None):
-        params = params or {}
-        if self.navi_sprites.current_animation != "buster":
-            self.navi_sprites.play_buster()
-        proj = Projectile(
+        params = params or _NO_PARAMS
+        self._ensure_anim(BUSTER)
+        self._spawn_projectile(
             self.navi_x + 0.5, self.navi_y, 1, 0,
-            chip.power, self.colors["accent_cyan"], from_enemy=False,
+            chip.power, self._c_cyan, from_enemy=False,
             speed=float(params.get("speed", 6.0)),
             pierce=bool(params.get("pierce", False))
         )
-        self.projectiles.append(proj)
 
     def _fire_shotgun(self, chip, params):
-        if self.navi_sprites.current_animation != "buster":
-            self.navi_sprites.play_buster()
+        self._ensure_anim(BUSTER)
 
         def on_hit(enemy, hx, hy):
-            bx, by = int(hx) + 1, int(hy)
-            for e in self.enemies:
-                if e.alive and e.x == bx and e.y == by:
-                    self._enemy_hit(e, chip.power)
+            e = self._tile_index.get((int(hx) + 1, int(hy)))
+            if e is not None:
+                self._enemy_hit(e, chip.power)
 
-        proj = Projectile(
+        self._spawn_projectile(
             self.navi_x + 0.5, self.navi_y, 1, 0,
-            chip.power, self.colors["accent_cyan"], from_enemy=False,
+            chip.power, self._c_cyan, from_enemy=False,
             speed=float(params.get("speed", 6.5)),
             pierce=False, on_hit=on_hit
         )
-        self.projectiles.append(proj)
 
     def _fire_spreader(self, chip, params):
-        if self.navi_sprites.current_animation != "buster":
-            self.navi_sprites.play_buster()
+        self._ensure_anim(BUSTER)
         diagonals = bool(params.get("diagonals", True))
 
         def on_hit(enemy, hx, hy):
@@ -564,38 +797,34 @@ class BattleScene(BaseScene):
             if diagonals:
                 targets += [(base_x + 1, base_y - 1), (base_x + 1, base_y + 1)]
             for tx, ty in targets:
-                if not (0 <= tx < self.grid_cols and 0 <= ty < self.grid_rows):
-                    continue
-                for e in self.enemies:
-                    if e.alive and e.x == tx and e.y == ty:
-                        self._enemy_hit(e, chip.power)
+                e = self._tile_index.get((tx, ty))
+                if e is not None:
+                    self._enemy_hit(e, chip.power)
 
-        proj = Projectile(
+        self._spawn_projectile(
             self.navi_x + 0.5, self.navi_y, 1, 0,
-            chip.power, self.colors["accent_cyan"], from_enemy=False,
+            chip.power, self._c_cyan, from_enemy=False,
             speed=float(params.get("speed", 6.0)),
             pierce=False, on_hit=on_hit
         )
-        self.projectiles.append(proj)
 
     def _fire_airshot(self, chip, params):
-        if self.navi_sprites.current_animation != "buster":
-            self.navi_sprites.play_buster()
+        self._ensure_anim(BUSTER)
         push = int(params.get("push", 1))
 
         def on_hit(enemy, hx, hy):
-            new_x = min(5, enemy.x + push)
-            occupied = any(e.alive and e is not enemy and e.x == new_x and e.y == enemy.y for e in self.enemies)
-            if not occupied:
-                enemy.x = max(3, new_x)
+            new_x = max(3, min(5, enemy.x + push))
+            if enemy.alive and (new_x, enemy.y) not in self._tile_index:
+                del self._tile_index[(enemy.x, enemy.y)]
+                enemy.x = new_x
+                self._tile_index[(new_x, enemy.y)] = enemy
 
-        proj = Projectile(
+        self._spawn_projectile(
             self.navi_x + 0.5, self.navi_y, 1, 0,
-            chip.power, self.colors["accent_cyan"], from_enemy=False,
+            chip.power, self._c_cyan, from_enemy=False,
             speed=float(params.get("speed", 7.0)),
             pierce=False, on_hit=on_hit
         )
-        self.projectiles.append(proj)
 
     def _use_sword(self, chip):
         self.navi_sprites.play_sword()
@@ -608,11 +837,11 @@ class BattleScene(BaseScene):
             if 0 <= target_x < self.grid_cols and 0 <= target_y < self.grid_rows:
                 hit_positions.append((target_x, target_y))
 
-                for enemy in self.enemies:
-                    if enemy.alive and enemy.x == target_x and int(enemy.y) == target_y:
-                        self._enemy_hit(enemy, chip.power)
+                enemy = self._tile_index.get((target_x, target_y))
+                if enemy is not None:
+                    self._enemy_hit(enemy, chip.power)
 
-        color = self.colors["accent_cyan"]
+        color = self._c_cyan
         if "Fire" in chip.name:
             color = (255, 100, 50)
         elif "Aqua" in chip.name:
@@ -621,41 +850,45 @@ class BattleScene(BaseScene):
         self.slash_effects.append(SlashEffect(hit_positions, color, 0.25))
 
     def _update_enemies(self, dt):
-        for enemy in self.enemies:
-            if not enemy.alive:
-                continue
-
-            # Update sprite animation
-            if enemy.sprite_manager:
-                enemy.sprite_manager.update(dt)
+        # Sprite managers are shared per enemy type, so advance each once
+        update_enemy_sprites(dt)
 
+        for enemy in self._alive_enemies:
             enemy.move_timer -= dt
             if enemy.move_timer <= 0:
-                enemy.move_timer = random.uniform(0.6, 1.2)
+                enemy.move_timer = _uniform(0.6, 1.2)
                 self._enemy_move(enemy)
 
             enemy.attack_timer -= dt
             if enemy.attack_timer <= 0:
-                enemy.attack_timer = random.uniform(1.0, 2.0)
+                enemy.attack_timer = _uniform(1.0, 2.0)
                 self._enemy_attack(enemy)
 
     def _enemy_move(self, enemy):
-        if random.random() < 0.5:
+        if _random() < 0.5:
             return
 
-        if random.random() < 0.6:
-            if enemy.y < self.navi_y and enemy.y < 2:
-                enemy.y += 1
-            elif enemy.y > self.navi_y and enemy.y > 0:
-                enemy.y -= 1
+        x, y = enemy.x, enemy.y
+        if _random() < 0.6:
+            if y < self.navi_y and y < 2:
+                y += 1
+            elif y > self.navi_y and y > 0:
+                y -= 1
         else:
-            if enemy.x < 5 and random.random() < 0.3:
-                enemy.x += 1
-            elif enemy.x > 3 and random.random() < 0.4:
-                enemy.x -= 1
+            if x < 5 and _random() < 0.3:
+                x += 1
+            elif x > 3 and _random() < 0.4:
+                x -= 1
+
+        x = max(3, min(5, x))
+        y = max(0, min(2, y))
 
-        enemy.x = max(3, min(5, enemy.x))
-        enemy.y = max(0, min(2, enemy.y))
+        # One enemy per tile, so the tile index stays a plain lookup
+        if (x, y) in self._tile_index:
+            return
+        del self._tile_index[(enemy.x, enemy.y)]
+        enemy.x, enemy.y = x, y
+        self._tile_index[(x, y)] = enemy
 
     def _enemy_attack(self, enemy):
         """Enemy attack - use wave attack for Metaur, normal projectile for others."""
@@ -679,7 +912,7 @@ class BattleScene(BaseScene):
         else:
             # Other enemies use normal projectile
             color = (255, 100, 50) if enemy.is_boss else (255, 180, 50)
-            proj = Projectile(
+            self._spawn_projectile(
                 enemy.x - 0.5, enemy.y,
                 -1, 0,
                 enemy.attack,
@@ -687,29 +920,30 @@ class BattleScene(BaseScene):
                 from_enemy=True,
                 speed=3.5
             )
-            self.projectiles.append(proj)
 
     def _navi_hit(self, damage):
         if self.navi_invis_timer > 0:
             return
 
-        navi = self.game_state["navi"]
+        navi = self._navi
         actual = max(1, damage - navi["defense"])
         navi["hp"] = max(0, navi["hp"] - actual)
         self.hit_flash = 1.0
         self.navi_sprites.play_hurt()
         self.shake = 1.0
         sx, sy = self._grid_to_screen(self.navi_x, self.navi_y)
-        self.damage_popups.append([sx, sy - 10, f"-{actual}", 1.0, self.colors["hp_red"]])
+        self.damage_popups.append([sx, sy - 10, f"-{actual}", 1.0, self._c_red])
 
     def _enemy_hit(self, enemy, damage):
         actual = max(1, damage - enemy.defense)
         enemy.hp -= actual
-        if enemy.hp <= 0:
+        if enemy.hp <= 0 and enemy.alive:
             enemy.alive = False
+            del self._tile_index[(enemy.x, enemy.y)]
+            self._alive_enemies.remove(enemy)
         self.shake = 0.4
         sx, sy = self._grid_to_screen(enemy.x, enemy.y)
-        self.damage_popups.append([sx, sy - 10, f"-{actual}", 1.0, self.colors["accent_cyan"]])
+        self.damage_popups.append([sx, sy - 10, f"-{actual}", 1.0, self._c_cyan])
 
     def _open_custom_screen(self):
         self.phase = "custom"
@@ -724,15 +958,16 @@ class BattleScene(BaseScene):
         else:
             self.drawn_chips = folder_chips.copy()
         
-        self.selected_chips = []
+        self.selected_slots = []
         self.chip_cursor = 0
 
         if not self.drawn_chips:
             self.phase = "battle"
 
     def _close_custom_screen(self):
-        self.chip_queue = self.selected_chips.copy()
-        self.selected_chips = []
+        drawn = self.drawn_chips
+        self.chip_queue = [drawn[i] for i in self.selected_slots]
+        self.selected_slots = []
         self.phase = "battle"
 
     def _win(self):
@@ -750,8 +985,7 @@ class BattleScene(BaseScene):
                 self.rewards["chips"].append(dropped)
                 # Add to owned chips
                 owned_chips = self.game_state["chip_folder"]["owned_chips"]
-                chip_obj = Chip(dropped, CHIP_DATABASE[dropped].power, CHIP_DATABASE[dropped].chip_type)
-                owned_chips.append(chip_obj)
+                owned_chips.append(copy.copy(CHIP_DATABASE[dropped]))
         
         # Equipment drop (3% chance)
         equipment_drop = roll_equipment_drop()
@@ -783,12 +1017,14 @@ class BattleScene(BaseScene):
             elif action == "right":
                 self.chip_cursor = min(len(self.drawn_chips) - 1, self.chip_cursor + 1)
             elif action == "confirm":
+                # Selection is by hand slot, so duplicate (equal) chips
+                # in the hand are picked independently
                 if self.chip_cursor < len(self.drawn_chips):
-                    chip = self.drawn_chips[self.chip_cursor]
-                    if chip in self.selected_chips:
-                        self.selected_chips.remove(chip)
-                    elif len(self.selected_chips) < 5:
-                        self.selected_chips.append(chip)
+                    slot = self.chip_cursor
+                    if slot in self.selected_slots:
+                        self.selected_slots.remove(slot)
+                    elif len(self.selected_slots) < 5:
+                        self.selected_slots.append(slot)
             elif action == "cancel" or action == "start":
                 self._close_custom_screen()
 
@@ -799,56 +1035,44 @@ class BattleScene(BaseScene):
                 self.manager.change_scene("hub")
 
     def _grid_to_screen(self, gx, gy):
-        sx = self.grid_x + int(gx) * self.cell_width + self.cell_width // 2
-        sy = self.grid_y + int(gy) * self.cell_height + self.cell_height // 2
-        return sx, sy
+        """Integer screen center of a cell; whole-number coordinates hit the cache directly."""
+        center = self._cell_centers.get((gx, gy))
+        if center is None:
+            key = (int(gx), int(gy))
+            center = self._cell_centers.get(key)
+            if center is None:
+                # Off-grid positions aren't cached
+                gx, gy = key
+                center = (self.grid_x + gx * self.cell_width + self.cell_width // 2,
+                          self.grid_y + gy * self.cell_height + self.cell_height // 2)
+        return center
 
     def draw(self, screen):
+        self._draw_battle(screen)
+
+        if self.phase == "custom":
+            self._draw_custom_screen(screen)
+        elif self.phase == "win":
+            self._draw_win(screen)
+        elif self.phase == "lose":
+            self._draw_lose(screen)
+
+    def _draw_battle(self, screen):
         screen.fill((15, 15, 25))
 
-        shake_x = int(math.sin(self.anim_timer * 50) * self.shake * 2) if self.shake > 0 else 0
+        shake_x = int(_SIN_LUT[int(self.anim_timer * 50 * _SIN_STEPS) & 255] * self.shake * 2) if self.shake > 0 else 0
 
         self._draw_grid(screen, shake_x)
         self._draw_slashes(screen, shake_x)
         self._draw_impacts(screen, shake_x)
         self._draw_projectiles(screen, shake_x)
-        self._draw_wave_attacks(screen, shake_x)
-
-        for enemy in self.enemies:
-            if enemy.alive:
-                self._draw_enemy(screen, enemy, shake_x)
-
+        self._draw_sprite_batch(screen, shake_x)
         self._draw_navi(screen, shake_x)
         self._draw_popups(screen)
         self._draw_ui(screen)
 
-        if self.phase == "custom":
-            self._draw_custom_screen(screen)
-
-        if self.phase == "win":
-            self._draw_win(screen)
-        elif self.phase == "lose":
-            self._draw_lose(screen)
-
     def _draw_grid(self, screen, shake_x):
-        for row in range(self.grid_rows):
-            for col in range(self.grid_cols):
-                x = self.grid_x + col * self.cell_width + shake_x
-                y = self.grid_y + row * self.cell_height
-
-                if col < 3:
-                    panel_color = (40, 80, 160)
-                    panel_light = (60, 110, 200)
-                    panel_dark = (25, 50, 110)
-                else:
-                    panel_color = (160, 50, 60)
-                    panel_light = (200, 70, 80)
-                    panel_dark = (110, 30, 40)
-
-                pygame.draw.rect(screen, panel_color, (x+1, y+1, self.cell_width-2, self.cell_height-2))
-                pygame.draw.line(screen, panel_light, (x+1, y+1), (x+self.cell_width-2, y+1), 1)
-                pygame.draw.line(screen, panel_dark, (x+1, y+self.cell_height-2), (x+self.cell_width-2, y+self.cell_height-2), 1)
-                pygame.draw.rect(screen, (80, 80, 100), (x, y, self.cell_width, self.cell_height), 1)
+        screen.blit(self._grid_surface, (self.grid_x + shake_x, self.grid_y))
 
     def _draw_slashes(self, screen, shake_x):
         for slash in self.slash_effects:
@@ -859,53 +1083,73 @@ class BattleScene(BaseScene):
                 pygame.draw.arc(screen, (255, 255, 255), (sx-6, sy-6, 12, 12), 0.7, 2.3, 1)
 
     def _draw_impacts(self, screen, shake_x):
-        for imp in self.impact_effects:
+        now = self.anim_timer
+        for _, _, imp in self._impact_heap:
             sx, sy = self._grid_to_screen(imp.gx, imp.gy)
             sx += shake_x
-            t = max(0.0, min(1.0, 1.0 - imp.timer / 0.6))
+            t = max(0.0, min(1.0, 1.0 - (imp.expires - now) / 0.6))
             r = 3 + int(3 * t)
             pygame.draw.circle(screen, imp.color, (sx, sy), r, 1)
 
     def _draw_projectiles(self, screen, shake_x):
-        for proj in self.projectiles:
-            sx = self.grid_x + proj.x * self.cell_width + shake_x
-            sy = self.grid_y + proj.y * self.cell_height + self.cell_height // 2
-            pygame.draw.circle(screen, proj.color, (int(sx), int(sy)), 3)
-            pygame.draw.circle(screen, (255, 255, 200), (int(sx), int(sy)), 1)
+        if not self.projectiles:
+            return
 
-    def _draw_wave_attacks(self, screen, shake_x):
-        """Draw Metaur wave attacks."""
+        # One pre-drawn sprite per projectile color (radius 3 with a bright core)
+        sprites = {}
+        blits = []
+        x0 = self.grid_x + shake_x
+        y0 = self.grid_y + self.cell_height // 2
+        cw, ch = self.cell_width, self.cell_height
+        for proj in self.projectiles:
+            sprite = sprites.get(proj.color)
+            if sprite is None:
+                sprite = sprites[proj.color] = _disc_sprite(((proj.color, 3, 0), ((255, 255, 200), 1, 0)))
+            blits.append((sprite, (int(x0 + proj.x * cw) - 3, int(y0 + proj.y * ch) - 3)))
+        self.draw_batch(screen, blits)
+
+    def _draw_sprite_batch(self, screen, shake_x):
+        """Draw Metaur wave attacks, enemy sprites and placeholders, then HP bars, in one batched blit."""
+        blits = []
         for wave in self.wave_attacks:
-            wave.draw(screen, self.grid_x, self.grid_y, self.cell_width, self.cell_height, shake_x)
-
-    def _draw_enemy(self, screen, enemy, shake_x):
-        sx, sy = self._grid_to_screen(enemy.x, enemy.y)
-        sx += shake_x
-
-        # Use sprite if available (Metaur)
-        if enemy.sprite_manager:
-            bob = math.sin(self.anim_timer * 3 + enemy.x) * 1
-            enemy.sprite_manager.draw(screen, sx, int(sy - bob), scale=0.55, center=True)
-        else:
-            # Placeholder for other enemies
-            size = 8 if enemy.is_boss else 6
-            color = (200, 60, 60) if enemy.is_boss else (180, 140, 60)
-            bob = math.sin(self.anim_timer * 3 + enemy.x) * 1
-
-            pygame.draw.circle(screen, color, (int(sx), int(sy - bob)), size)
-            pygame.draw.circle(screen, (255, 255, 255), (int(sx), int(sy - bob)), size, 1)
-
-        # HP bar
-        bar_w = 12
-        hp_pct = enemy.hp / enemy.max_hp
-        pygame.draw.rect(screen, (40, 20, 20), (sx - bar_w//2, sy - 10, bar_w, 2))
-        pygame.draw.rect(screen, (220, 60, 60), (sx - bar_w//2, sy - 10, int(bar_w * hp_pct), 2))
+            pair = wave.get_blit_pair(self.grid_x, self.grid_y, self.cell_width, self.cell_height, shake_x)
+            if pair is not None:
+                blits.append(pair)
+
+        for enemy in self._alive_enemies:
+            sx, sy = self._grid_to_screen(enemy.x, enemy.y)
+            bob = _SIN_LUT[int((self.anim_timer * 3 + enemy.x) * _SIN_STEPS) & 255]
+            x = sx + shake_x
+            y = int(sy - bob)
+            if enemy.sprite_manager:
+                pair = enemy.sprite_manager.get_blit_pair(x, y, scale=0.55, center=True)
+                if pair is not None:
+                    blits.append(pair)
+            else:
+                # Placeholder body for enemies without sprites
+                body, size = self._enemy_body(enemy.is_boss)
+                blits.append((body, (x - size, y - size)))
+
+        # HP bars over every body (12px wide, centered 10px above the cell center)
+        hp_bars = self._hp_bars
+        for enemy in self._alive_enemies:
+            sx, sy = self._grid_to_screen(enemy.x, enemy.y)
+            blits.append((hp_bars[12 * enemy.hp // enemy.max_hp], (sx + shake_x - 6, sy - 10)))
+
+        self.draw_batch(screen, blits)
+
+    def _enemy_body(self, is_boss):
+        """Placeholder (sprite, radius) for enemies without sprites, built once per kind."""
+        body = self._enemy_bodies.get(is_boss)
+        if body is None:
+            size = 8 if is_boss else 6
+            color = (200, 60, 60) if is_boss else (180, 140, 60)
+            body = self._enemy_bodies[is_boss] = (_disc_sprite(((color, size, 0), ((255, 255, 255), size, 1))), size)
+        return body
 
     def _draw_navi(self, screen, shake_x):
         """Draw Navi with sprite animations."""
-        sx, sy = self._grid_to_screen(self.navi_x, self.navi_y)
-        sx += shake_x
-
+        # Blink checks first so hidden frames skip the position lookup
         # Hit flash
         if self.hit_flash > 0 and int(self.hit_flash * 10) % 2 == 0:
             return
@@ -914,70 +1158,113 @@ class BattleScene(BaseScene):
         if self.navi_invis_timer > 0 and int(self.anim_timer * 12) % 2 == 0:
             return
 
+        sx, sy = self._grid_to_screen(self.navi_x, self.navi_y)
+        sx += shake_x
+
         # Draw sprite (increased scale for better visibility - 25% larger)
         self.navi_sprites.draw(screen, sx, sy, scale=0.44, center=True)
 
     def _draw_popups(self, screen):
-        for popup in self.damage_popups:
-            x, y, text, timer, color = popup
-            y -= (1.0 - timer) * 8
-            self.draw_text(screen, text, int(x), int(y), size=7, center=True, color=color)
+        if not self.damage_popups:
+            return
+        get_text = self.get_text
+        blits = []
+        for x, y, text, timer, color in self.damage_popups:
+            surface = get_text(text, 7, color)
+            w, h = surface.get_size()
+            blits.append((surface, (int(x) - (w >> 1), int(y - (1.0 - timer) * 8) - (h >> 1))))
+        self.draw_batch(screen, blits)
 
     def _draw_ui(self, screen):
-        navi = self.game_state["navi"]
+        navi = self._navi
 
-        # Compact UI for 128x128
-        self.draw_panel(screen, 1, 1, 35, 10, border_width=1)
-        self.draw_progress_bar(screen, 2, 2, 30, 4, navi["hp"], navi["max_hp"])
-        self.draw_text(screen, f"{navi['hp']}", 2, 6, size=6, color=self.colors["text_white"])
+        # Compact UI for 128x128. The status block and the gauge are kept as
+        # composites, re-rendered only when the values they show change
+        hp, max_hp = navi["hp"], navi["max_hp"]
+        key = (hp, max_hp, self.navi_invis_timer > 0,
+               self.chip_queue[0].name[:6] if self.chip_queue else None)
+        if key != self._hud_status_key:
+            self._hud_status_key = key
+            self._render_hud_status(*key)
 
-        # Invis indicator
-        if self.navi_invis_timer > 0:
-            self.draw_text(screen, "INV", 25, 6, size=6, color=self.colors["accent_cyan"])
-
-        # Chip queue
-        if self.chip_queue:
-            self.draw_panel(screen, 1, 12, 35, 8, border_width=1)
-            chip_name = self.chip_queue[0].name[:6]
-            self.draw_text(screen, f"[X]{chip_name}", 2, 13, size=6, color=self.colors["accent_cyan"])
-
-        # Custom gauge
         gauge_pct = self.custom_gauge / self.custom_gauge_max
         bar_w = self.width - 4
-        pygame.draw.rect(screen, (30, 30, 50), (2, self.height - 6, bar_w, 4))
-        pygame.draw.rect(screen, self.colors["accent_cyan"], (2, self.height - 6, int(bar_w * gauge_pct), 4))
-        pygame.draw.rect(screen, (100, 100, 120), (2, self.height - 6, bar_w, 4), 1)
+        key = (min(int(bar_w * gauge_pct) - 1, bar_w - 2), gauge_pct >= 1.0)
+        if key != self._hud_gauge_key:
+            self._hud_gauge_key = key
+            self._render_hud_gauge(*key)
+
+        # Enemy count (_alive_enemies is kept current by _enemy_hit); the
+        # label is only formatted and looked up when the count changes
+        alive = len(self._alive_enemies)
+        if alive != self._virus_count:
+            self._virus_count = alive
+            self._virus_label = self.get_text(f"V:{alive}", 6, self._c_dim)
+
+        self.draw_batch(screen, [
+            (self._hud_status, (1, 1)),
+            (self._hud_gauge, (0, self.height - 6)),
+            (self._virus_label, (self.width - 15, 2)),
+        ])
+
+    def _render_hud_status(self, hp, max_hp, invis, chip_name):
+        """Redraw the top-left HP / invis / queued chip block (screen offset 1, 1)."""
+        surf = self._hud_status
+        surf.fill((0, 0, 0, 0))
+
+        # Static HP panel and bar frame, then the fill inside the bar's 1px border
+        surf.blit(self._hp_frame, (0, 0))
+        pct = hp / max_hp if max_hp > 0 else 0
+        fill_w = min(int(pct * 30) - 1, 28)
+        if fill_w > 0:
+            surf.fill(self.bar_color(pct), (2, 2, fill_w, 2))
+        surf.blit(self.get_text(f"{hp}", 6, self._c_white), (1, 5))
 
-        if gauge_pct >= 1.0:
-            self.draw_text(screen, "[Z]CSTM", self.width - 25, self.height - 5, size=6, color=self.colors["accent_cyan"])
+        # Invis indicator
+        if invis:
+            surf.blit(self.get_text("INV", 6, self._c_cyan), (24, 5))
 
-        # Enemy count
-        alive = sum(1 for e in self.enemies if e.alive)
-        self.draw_text(screen, f"V:{alive}", self.width - 15, 2, size=6, color=self.colors["text_dim"])
+        # Chip queue
+        if chip_name is not None:
+            self.draw_panel(surf, 0, 11, 35, 8, border_width=1)
+            surf.blit(self.get_text(f"[X]{chip_name}", 6, self._c_cyan), (1, 12))
+
+    def _render_hud_gauge(self, fill_w, full):
+        """Redraw the custom gauge strip along the bottom edge (screen y height - 6)."""
+        surf = self._hud_gauge
+        surf.fill((0, 0, 0, 0))
+        surf.blit(self._gauge_frame, (2, 0))
+        if fill_w > 0:
+            surf.fill(self._c_cyan, (3, 1, fill_w, 2))
+        if full:
+            surf.blit(self.get_text("[Z]CSTM", 6, self._c_cyan), (self.width - 25, 1))
 
     def _draw_custom_screen(self, screen):
-        overlay = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 180))
-        screen.blit(overlay, (0, 0))
+        # Dimming overlay and title never change, so they're rendered once
+        if self._custom_bg is None:
+            self._custom_bg = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
+            self._custom_bg.fill((0, 0, 0, 180))
+            self.draw_text(self._custom_bg, "SELECT CHIP", self.width // 2, 5, size=10, center=True, color=self._c_cyan)
+            self._custom_bg = self._custom_bg.convert_alpha()
+        screen.blit(self._custom_bg, (0, 0))
 
-        self.draw_text(screen, "SELECT CHIP", self.width // 2, 5, size=10, center=True, color=self.colors["accent_cyan"])
-        self.draw_text(screen, f"{len(self.selected_chips)}/5", self.width // 2, 15, size=7, center=True, color=self.colors["text_dim"])
+        cyan, dim = self._c_cyan, self._c_dim
+        self.draw_text(screen, f"{len(self.selected_slots)}/5", self.width // 2, 15, size=7, center=True, color=dim)
 
         # Show only 1 chip at a time for readability on small screen
         if not self.drawn_chips:
-            self.draw_text(screen, "No chips!", self.width // 2, self.height // 2, size=10, center=True, color=self.colors["text_dim"])
+            self.draw_text(screen, "No chips!", self.width // 2, self.height // 2, size=10, center=True, color=dim)
             return
         
         chip = self.drawn_chips[self.chip_cursor]
-        is_selected = chip in self.selected_chips
+        is_selected = self.chip_cursor in self.selected_slots
         
-        # Large centered card
+        # Large centered card (panel pre-rendered per selection state)
         card_w, card_h = 80, 70
         x = (self.width - card_w) // 2
         y = 30
         
-        bg = self.colors["hp_green"] if is_selected else self.colors["accent_cyan"]
-        self.draw_panel(screen, x, y, card_w, card_h, color=bg, border_width=2)
+        screen.blit(self._card_panel(is_selected, card_w, card_h), (x, y))
         
         tc = self.colors["bg_dark"]
         # Chip name (larger, readable)
@@ -989,20 +1276,37 @@ class BattleScene(BaseScene):
         
         # Navigation arrows
         if self.chip_cursor > 0:
-            self.draw_text(screen, "◄", 10, self.height // 2, size=16, center=True, color=self.colors["accent_cyan"])
+            self.draw_text(screen, "◄", 10, self.height // 2, size=16, center=True, color=cyan)
         if self.chip_cursor < len(self.drawn_chips) - 1:
-            self.draw_text(screen, "►", self.width - 10, self.height // 2, size=16, center=True, color=self.colors["accent_cyan"])
+            self.draw_text(screen, "►", self.width - 10, self.height // 2, size=16, center=True, color=cyan)
         
         # Chip counter
-        self.draw_text(screen, f"{self.chip_cursor + 1}/{len(self.drawn_chips)}", self.width // 2, y + card_h + 8, size=8, center=True, color=self.colors["text_white"])
+        self.draw_text(screen, f"{self.chip_cursor + 1}/{len(self.drawn_chips)}", self.width // 2, y + card_h + 8, size=8, center=True, color=self._c_white)
         
         # Controls
-        self.draw_text(screen, "[Z]Sel [X]OK", self.width // 2, self.height - 10, size=7, center=True, color=self.colors["text_dim"])
+        self.draw_text(screen, "[Z]Sel [X]OK", self.width // 2, self.height - 10, size=7, center=True, color=dim)
+
+    def _card_panel(self, is_selected, card_w, card_h):
+        """Chip card background (green when selected), drawn once per state."""
+        panel = self._card_panels.get(is_selected)
+        if panel is None:
+            panel = pygame.Surface((card_w, card_h)).convert()
+            bg = self._c_green if is_selected else self._c_cyan
+            self.draw_panel(panel, 0, 0, card_w, card_h, color=bg, border_width=2)
+            self._card_panels[is_selected] = panel
+        return panel
+
+    def _overlay(self, color):
+        """Full-screen translucent fill for result screens, built once per color."""
+        overlay = self._overlays.get(color)
+        if overlay is None:
+            overlay = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
+            overlay.fill(color)
+            overlay = self._overlays[color] = overlay.convert_alpha()
+        return overlay
 
     def _draw_win(self, screen):
-        overlay = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 160))
-        screen.blit(overlay, (0, 0))
+        screen.blit(self._overlay((0, 0, 0, 160)), (0, 0))
 
         self.draw_text(screen, "VICTORY!", self.width // 2, 20, size=12, center=True, color=self.colors["accent_cyan"])
         self.draw_text(screen, f"+{self.rewards['zenny']}z", self.width // 2, 35, size=10, center=True, color=self.colors["accent_yellow"])
@@ -1024,9 +1328,7 @@ class BattleScene(BaseScene):
         self.draw_text(screen, "[Z]Continue", self.width // 2, self.height - 12, size=6, center=True, color=self.colors["text_dim"])
 
     def _draw_lose(self, screen):
-        overlay = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
-        overlay.fill((40, 0, 0, 160))
-        screen.blit(overlay, (0, 0))
+        screen.blit(self._overlay((40, 0, 0, 160)), (0, 0))
 
         self.draw_text(screen, "DELETED", self.width // 2, self.height // 2 - 10, size=12, center=True, color=self.colors["hp_red"])
         self.draw_text(screen, "Wait 1hr", self.width // 2, self.height // 2 + 5, size=7, center=True, color=self.colors["text_dim"])
@@ -103,8 +103,8 @@ class EquipmentScene(BaseScene):
             tc = self.colors["bg_dark"] if is_selected else self.colors["text_white"]
             
             # Get equipment data
-            item_data = EQUIPMENT_DB.get(item_name, {})
-            cost = item_data.get("cost", 0)
+            item_data = EQUIPMENT_DB.get(item_name)
+            cost = item_data.cost if item_data else 0
             
             # Item name
             name_display = item_name[:12]  # Truncate if too long
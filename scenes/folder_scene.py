@@ -98,12 +98,15 @@ class FolderScene(BaseScene):
         end_idx = min(start_idx + self.max_visible, len(owned_chips))
         visible_chips = owned_chips[start_idx:end_idx]
         
+        # Folder entries by object identity (equal duplicates are distinct chips)
+        folder_ids = {id(c) for c in folder_chips}
+        
         for i, chip in enumerate(visible_chips):
             actual_idx = start_idx + i
             is_selected = actual_idx == self.selected_index
             
             # Check if THIS specific chip object is in folder
-            is_equipped = chip in folder_chips
+            is_equipped = id(chip) in folder_ids
             
             # Background color
             if is_selected:
@@ -9,6 +9,7 @@ import math
 import os
 from pathlib import Path
 from scenes.base_scene import BaseScene
+from resources import load_image_scaled, list_dir
 
 
 class HubScene(BaseScene):
@@ -51,11 +52,10 @@ class HubScene(BaseScene):
         ]
         
         for path in possible_paths:
-            if path.exists():
+            if path.name in list_dir(path.parent):
                 try:
-                    img = pygame.image.load(str(path)).convert_alpha()
                     # Scale to fit 128x128 display (about 40x40 for mugshot)
-                    scaled = pygame.transform.scale(img, (40, 40))
+                    scaled = load_image_scaled(str(path), (40, 40))
                     print(f"[HUB] Loaded mugshot from {path}")
                     return scaled
                 except Exception as e:
@@ -66,7 +66,7 @@ class HubScene(BaseScene):
         placeholder = pygame.Surface((40, 40), pygame.SRCALPHA)
         pygame.draw.circle(placeholder, (0, 120, 255), (20, 20), 18)
         pygame.draw.circle(placeholder, (0, 255, 200), (20, 20), 18, 2)
-        return placeholder
+        return placeholder.convert_alpha()
     
     def on_enter(self):
         """Update mood when entering hub."""
@@ -82,7 +82,7 @@ class NaviCustScene(BaseScene):
                     self.placing = False
                     self.selected_program = None
             else:
-                prog_at = self.navi_cust.grid[self.cursor_y][self.cursor_x]
+                prog_at = self.navi_cust.get_cell(self.cursor_x, self.cursor_y)
                 if prog_at:
                     self.navi_cust.uninstall(prog_at)
                 else:
@@ -182,7 +182,7 @@ class NaviCustScene(BaseScene):
                 cell_x = ox + x * cs
                 cell_y = oy + y * cs
                 
-                prog = self.navi_cust.grid[y][x]
+                prog = self.navi_cust.grid[y * gs + x]
                 if prog:
                     prog_data = NCP_DATABASE.get(prog)
                     color = self.prog_colors.get(prog_data.color if prog_data else "white", (150, 150, 150))
@@ -203,7 +203,7 @@ class NaviCustScene(BaseScene):
                     self.selected_program, self.cursor_x, self.cursor_y, self.rotation
                 )
                 color = (100, 200, 100) if can_place else (200, 100, 100)
-                shape = self.navi_cust._rotate_shape(prog.shape, self.rotation)
+                shape = prog.shape_rot[self.rotation % 4]
                 for dx, dy in shape:
                     px = ox + (self.cursor_x + dx) * cs
                     py = oy + (self.cursor_y + dy) * cs
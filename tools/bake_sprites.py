@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Bake Sprites - Pre-decode sprite PNGs into one raw RGBA pack per directory.
+
+Writes a sprites.pack into every directory under assets/sprites that holds
+animation frame PNGs. At launch, resources maps the pack once and builds surfaces straight
+from it instead of opening and decoding each PNG, which is the slowest part
+of loading on an SD card.
+
+Run from the project root after changing any sprite:
+    python tools/bake_sprites.py [sprite_dir]
+"""
+
+import os
+import struct
+import sys
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from resources import (
+    PACK_NAME, PACK_MAGIC, PACK_HEADER, PACK_NAME_LEN, PACK_ENTRY,
+    pack_frame_names, read_pack,
+)
+
+_to_bytes = getattr(pygame.image, "tobytes", None) or pygame.image.tostring
+
+
+def bake_dir(directory: str, names) -> None:
+    """Write the pack for one directory from the given PNG file names."""
+    frames = []
+    for name in names:
+        surface = pygame.image.load(os.path.join(directory, name))
+        frames.append((name.encode("utf-8"), surface.get_size(), _to_bytes(surface, "RGBA")))
+    
+    # Pixel data starts right after the index
+    index_size = PACK_HEADER.size + sum(
+        PACK_NAME_LEN.size + len(name) + PACK_ENTRY.size for name, _, _ in frames
+    )
+    
+    with open(os.path.join(directory, PACK_NAME), "wb") as f:
+        f.write(PACK_HEADER.pack(PACK_MAGIC, len(frames)))
+        offset = index_size
+        for name, (width, height), pixels in frames:
+            f.write(PACK_NAME_LEN.pack(len(name)))
+            f.write(name)
+            f.write(PACK_ENTRY.pack(width, height, offset))
+            offset += len(pixels)
+        for _, _, pixels in frames:
+            f.write(pixels)
+
+
+def _pack_current(directory: str, names) -> bool:
+    """Whether the directory's pack holds exactly these frames and is newer than all of them."""
+    pack = os.path.join(directory, PACK_NAME)
+    try:
+        data, index = read_pack(pack)
+        data.close()
+        newest = max(os.path.getmtime(os.path.join(directory, n)) for n in names)
+        return set(index) == set(names) and os.path.getmtime(pack) >= newest
+    except (OSError, ValueError, struct.error):
+        return False
+
+
+def bake(sprite_dir: str) -> int:
+    """Bake every directory under sprite_dir; returns the number of packs written."""
+    count = 0
+    for root, _dirs, files in os.walk(sprite_dir):
+        # Only real animation frames (not stray "... - Copy.png" duplicates)
+        names = pack_frame_names(files)
+        if not names:
+            continue
+        
+        if _pack_current(root, names):
+            continue
+        
+        bake_dir(root, names)
+        count += 1
+        print(f"Baked {len(names)} sprite(s) in {root}")
+    return count
+
+
+if __name__ == "__main__":
+    sprite_dir = sys.argv[1] if len(sys.argv) > 1 else os.path.join("assets", "sprites")
+    pygame.init()
+    print(f"{bake(sprite_dir)} pack(s) written")